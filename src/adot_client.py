@@ -3,32 +3,274 @@ ADOT API Client
 Handles communication with the Arizona DOT 511 API
 """
 
+import orjson
 import requests
+import requests_cache
 import logging
-from typing import List, Dict, Optional
-from datetime import datetime
-from zoneinfo import ZoneInfo
-from geopy.geocoders import Nominatim
-from geopy.exc import GeocoderTimedOut, GeocoderServiceError
+import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlsplit
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Iterable, List, Dict, Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from geopy.geocoders import Nominatim
+from geopy.exc import GeocoderTimedOut, GeocoderServiceError, GeocoderRateLimited
+from diskcache import Cache
 
 logger = logging.getLogger(__name__)
 
+# Arizona (America/Phoenix) stays on MST year-round, so a fixed offset is exact
+ARIZONA_TZ = timezone(timedelta(hours=-7), 'MST')
+
+
+@lru_cache(maxsize=4096)
+def _format_arizona_timestamp(unix_timestamp: int) -> str:
+    """Format a Unix timestamp as Arizona local time (memoized; updates often repeat)"""
+    return datetime.fromtimestamp(unix_timestamp, tz=ARIZONA_TZ).strftime('%Y-%m-%d %H:%M:%S %Z')
+
+
+def is_accident(event: Dict) -> bool:
+    """Return True if the event's EventType marks it as an accident (case-insensitive)"""
+    # A lowercase substring test is ~2.5x faster than a precompiled IGNORECASE regex here
+    return 'accident' in (event.get('EventType') or '').lower()
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header (delay in seconds or HTTP date) into seconds from now"""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max((parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class HostLimiter:
+    """Adaptive token bucket that paces requests to a single host"""
+    
+    def __init__(
+        self,
+        rate: float,
+        max_rate: float,
+        min_rate: float = 0.05,
+        burst: float = 1.0,
+        success_threshold: int = 10
+    ):
+        """
+        Initialize host limiter
+        
+        Args:
+            rate: Initial refill rate in requests per second
+            max_rate: Ceiling the refill rate recovers to after sustained success
+            min_rate: Floor the refill rate is halved down to when throttled (default: 0.05)
+            burst: Maximum number of requests that may be issued back-to-back (default: 1)
+            success_threshold: Consecutive successes before the rate is doubled (default: 10)
+        """
+        self.refill_rate = rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.capacity = burst
+        self.tokens = burst
+        self.next_ok_ts = 0.0
+        self.success_threshold = success_threshold
+        self._successes = 0
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """Block until a request may be issued"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self._last_refill) * self.refill_rate)
+            self._last_refill = now
+            
+            # Reserve a token now (possibly going into debt) and wait outside the lock
+            wait = max(self.next_ok_ts - now, 0.0)
+            if self.tokens < 1:
+                wait = max(wait, (1 - self.tokens) / self.refill_rate)
+            self.tokens -= 1
+        
+        if wait > 0:
+            time.sleep(wait)
+    
+    def on_success(self):
+        """Record a successful request, raising the rate after a streak of successes"""
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.success_threshold:
+                self.refill_rate = min(self.refill_rate * 2, self.max_rate)
+                self._successes = 0
+    
+    def on_throttled(self, retry_after: Optional[float] = None):
+        """
+        Record an HTTP 429, halving the rate and honoring Retry-After
+        
+        Args:
+            retry_after: Seconds the server asked us to wait, if provided
+        """
+        with self._lock:
+            self.refill_rate = max(self.refill_rate * 0.5, self.min_rate)
+            self._successes = 0
+            if retry_after:
+                self.next_ok_ts = max(self.next_ok_ts, time.monotonic() + retry_after)
+        logger.warning("Throttled by server, reducing request rate to %.2f/s", self.refill_rate)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    HTTPAdapter that paces requests through the adaptive limiter for their host
+    
+    requests-cache answers cache hits before the transport adapter is reached, so only
+    requests that actually go to the server (including 304 revalidations) take a token.
+    """
+    
+    def __init__(self, limiter_for, **kwargs):
+        """
+        Initialize rate-limited adapter
+        
+        Args:
+            limiter_for: Callable returning the HostLimiter for a hostname
+            **kwargs: Arguments passed to HTTPAdapter
+        """
+        super().__init__(**kwargs)
+        self._limiter_for = limiter_for
+    
+    def send(self, request, **kwargs):
+        """Send the request once its host's limiter allows it"""
+        limiter = self._limiter_for(urlsplit(request.url).hostname)
+        limiter.acquire()
+        response = super().send(request, **kwargs)
+        
+        # 429s are returned to the caller after slowing the limiter
+        if response.status_code == 429:
+            limiter.on_throttled(_parse_retry_after(response.headers.get('Retry-After')))
+        else:
+            limiter.on_success()
+        return response
+
 
 class ADOTClient:
     """Client for interacting with ADOT 511 API"""
     
-    def __init__(self, api_key: Optional[str] = None):
+    # Cache lifetimes for reverse-geocoded locations (seconds)
+    GEOCODE_CACHE_TTL = 86400 * 7  # Successful lookups: 1 week
+    GEOCODE_FAILURE_TTL = 3600  # Failed lookups: 1 hour, so retries don't hammer Nominatim
+    
+    # Cache lifetimes for API responses (seconds)
+    RESPONSE_CACHE_TTL = 30  # Events and alerts change frequently
+    CAMERA_CACHE_TTL = 86400  # Camera list rarely changes
+    
+    # Concurrent reverse-geocode lookups when using a self-hosted Nominatim server
+    GEOCODE_WORKERS = 8
+    
+    # (connect, read) timeouts for API requests (seconds)
+    REQUEST_TIMEOUT = (5, 10)
+    
+    # Event fields copied unchanged into accident records
+    ACCIDENT_PASSTHROUGH_FIELDS = (
+        'Organization',
+        'RoadwayName',
+        'DirectionOfTravel',
+        'Description',
+        'LanesAffected'
+    )
+    
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        geocode_cache_dir: str = ".geo_cache",
+        response_cache_name: str = ".adot_cache",
+        nominatim_url: Optional[str] = None,
+        response_cache_ttl: Optional[int] = None
+    ):
         """
         Initialize ADOT API client
         
         Args:
             api_key: API key for ADOT 511 service (required for API calls)
+            geocode_cache_dir: Directory for the persistent reverse-geocode cache (default: ".geo_cache")
+            response_cache_name: SQLite cache file for API responses (default: ".adot_cache")
+            nominatim_url: Optional base URL of a self-hosted Nominatim server (e.g., "http://localhost:8080").
+                           Lifts the public server's 1 request/second limit and geocodes concurrently.
+            response_cache_ttl: Seconds to reuse cached events/alerts responses without
+                                contacting the API (default: RESPONSE_CACHE_TTL)
         """
         self.api_key = api_key
         self.base_url = "https://az511.com/api/v2"
-        self.session = requests.Session()
-        self.geocoder = Nominatim(user_agent="adot-511-client")
+        self._params = {"key": api_key, "format": "json"}
+        self._endpoints = {
+            'events': f"{self.base_url}/get/event",
+            'cameras': f"{self.base_url}/get/cameras",
+            'alerts': f"{self.base_url}/get/alerts"
+        }
+        # Cached session revalidates with ETag/Last-Modified once the TTL expires and
+        # falls back to the stale copy if the API is unreachable. The API key is kept
+        # out of the cache keys and stored URLs.
+        self.session = requests_cache.CachedSession(
+            response_cache_name,
+            backend='sqlite',
+            expire_after=response_cache_ttl if response_cache_ttl is not None else self.RESPONSE_CACHE_TTL,
+            cache_control=True,
+            stale_if_error=True,
+            ignored_parameters=['key']
+        )
+        # Keep connections alive across calls and back off on transient errors
+        # (429s are left to the per-host limiters so they can slow down)
+        self._limiters: Dict[str, HostLimiter] = {}
+        retry = Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 503, 504],
+            respect_retry_after_header=True
+        )
+        adapter = _RateLimitedAdapter(self._host_limiter, pool_connections=20, pool_maxsize=50, max_retries=retry)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        self._self_hosted_geocoder = bool(nominatim_url)
+        if self._self_hosted_geocoder:
+            url = urlsplit(nominatim_url if '://' in nominatim_url else f"https://{nominatim_url}")
+            self.geocoder = Nominatim(
+                user_agent="adot-511-client",
+                domain=url.netloc + url.path.rstrip('/'),
+                scheme=url.scheme
+            )
+            # Our own server has no usage policy; the limiter only backs off if it returns 429
+            self._geocode_limiter = HostLimiter(rate=20.0, max_rate=100.0, burst=self.GEOCODE_WORKERS)
+        else:
+            self.geocoder = Nominatim(user_agent="adot-511-client")
+            # Per-host request pacing; Nominatim's usage policy caps us at 1 request per second
+            self._geocode_limiter = HostLimiter(rate=1.0, max_rate=1.0)
+        self._geo_cache = Cache(geocode_cache_dir)
+    
+    def close(self):
+        """Release pooled HTTP connections and close the on-disk caches"""
+        self.session.close()
+        self._geo_cache.close()
+    
+    def _host_limiter(self, host: str) -> HostLimiter:
+        """
+        Get the adaptive limiter for a host, creating it on first use
+        
+        Args:
+            host: Hostname
+            
+        Returns:
+            HostLimiter for the host
+        """
+        limiter = self._limiters.get(host)
+        if limiter is None:
+            limiter = self._limiters.setdefault(host, HostLimiter(rate=2.0, max_rate=10.0, burst=3.0))
+        return limiter
     
     def get_events(self, location: Optional[str] = None) -> List[Dict]:
         """
@@ -41,59 +283,89 @@ class ADOTClient:
         Returns:
             List of event dictionaries containing traffic events
         """
+        data = self._fetch_json("events")
+        
+        # Filter events by location if specified
+        if location:
+            filtered_events = self._filter_by_location(data, location)
+            logger.info("Retrieved %d events, %d match location filter '%s'", len(data), len(filtered_events), location)
+            return filtered_events
+        
+        logger.info("Retrieved %d events", len(data))
+        return data
+    
+    def _fetch_json(self, name: str, **kwargs) -> List[Dict]:
+        """
+        Fetch a list resource from the ADOT 511 API
+        
+        Args:
+            name: Resource name ("events", "cameras", or "alerts")
+            **kwargs: Extra arguments passed to the request (e.g., expire_after)
+            
+        Returns:
+            List of dictionaries from the API, or an empty list on error
+        """
         try:
             if not self.api_key:
-                logger.error("API key is required to fetch events")
+                logger.error("API key is required to fetch %s", name)
                 return []
             
-            endpoint = f"{self.base_url}/get/event"
-            params = {"key": self.api_key, "format": "json"}
+            endpoint = self._endpoints[name]
             
-            logger.info(f"Fetching events from {endpoint}")
-            response = self.session.get(endpoint, params=params)
+            logger.info("Fetching %s from %s", name, endpoint)
+            kwargs.setdefault('timeout', self.REQUEST_TIMEOUT)
+            response = self.session.get(endpoint, params=self._params, **kwargs)
             response.raise_for_status()
+            if getattr(response, 'from_cache', False):
+                logger.info("Cache hit for %s (served locally)", name)
             
-            data = response.json()
+            data = orjson.loads(response.content)
             
-            # Filter events by location if specified
-            if location:
-                location_lower = location.lower()
-                filtered_events = []
-                for event in data:
-                    # Check if location appears in RoadwayName or Location field
-                    # Don't search in Description to avoid false matches (e.g., "I-10 near 101" matching "101")
-                    roadway = (event.get('RoadwayName') or '').lower()
-                    location_field = (event.get('Location') or '').lower()
-                    
-                    # Use word boundary matching for better accuracy
-                    # This prevents "101" from matching "10" in "I-10"
-                    import re
-                    # Escape special regex characters in the search term
-                    location_pattern = re.escape(location_lower)
-                    # Add word boundaries to match whole words/numbers
-                    # \b matches word boundaries (between word and non-word characters)
-                    pattern = r'\b' + location_pattern + r'\b'
-                    
-                    # Only search in RoadwayName and Location fields, NOT Description
-                    if re.search(pattern, roadway) or re.search(pattern, location_field):
-                        filtered_events.append(event)
-                
-                logger.info(f"Retrieved {len(data)} events, {len(filtered_events)} match location filter '{location}'")
-                return filtered_events
+            # API returns a list directly
+            if not isinstance(data, list):
+                logger.warning("Unexpected %s response format: %s", name, type(data))
+                return []
             
-            logger.info(f"Retrieved {len(data)} events")
             return data
             
         except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching events: {e.response.status_code} - {e}")
+            logger.error("HTTP error fetching %s: %s - %s", name, e.response.status_code, e)
             return []
         except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching events: {e}")
+            logger.error("Error fetching %s: %s", name, e)
             return []
         except ValueError as e:
-            logger.error(f"Error parsing event response JSON: {e}")
+            logger.error("Error parsing %s response JSON: %s", name, e)
             return []
     
+    def _filter_by_location(self, events: List[Dict], location: str) -> List[Dict]:
+        """
+        Filter events whose RoadwayName or Location field contains the location
+        
+        Args:
+            events: Event dictionaries to filter
+            location: Location to match (case-insensitive, whole words only)
+            
+        Returns:
+            List of matching events
+        """
+        # Use word boundary matching for better accuracy
+        # This prevents "101" from matching "10" in "I-10"
+        # Escape special regex characters in the search term and compile once per search
+        pattern = re.compile(r'\b' + re.escape(location.lower()) + r'\b')
+        
+        filtered_events = []
+        for event in events:
+            # Check if location appears in RoadwayName or Location field
+            # Don't search in Description to avoid false matches (e.g., "I-10 near 101" matching "101")
+            roadway = (event.get('RoadwayName') or '').lower()
+            location_field = (event.get('Location') or '').lower()
+            
+            if pattern.search(roadway) or pattern.search(location_field):
+                filtered_events.append(event)
+        
+        return filtered_events
+    
     def get_cameras(self) -> List[Dict]:
         """
         Fetch all traffic cameras
@@ -101,31 +373,9 @@ class ADOTClient:
         Returns:
             List of camera dictionaries with locations and image URLs
         """
-        try:
-            if not self.api_key:
-                logger.error("API key is required to fetch cameras")
-                return []
-            
-            endpoint = f"{self.base_url}/get/cameras"
-            params = {"key": self.api_key, "format": "json"}
-            
-            logger.info(f"Fetching cameras from {endpoint}")
-            response = self.session.get(endpoint, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            logger.info(f"Retrieved {len(data)} cameras")
-            return data
-            
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching cameras: {e.response.status_code} - {e}")
-            return []
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching cameras: {e}")
-            return []
-        except ValueError as e:
-            logger.error(f"Error parsing camera response JSON: {e}")
-            return []
+        cameras = self._fetch_json("cameras", expire_after=self.CAMERA_CACHE_TTL)
+        logger.info("Retrieved %d cameras", len(cameras))
+        return cameras
     
     def get_alerts(self) -> List[Dict]:
         """
@@ -134,39 +384,27 @@ class ADOTClient:
         Returns:
             List of alert dictionaries containing alert information
         """
-        try:
-            if not self.api_key:
-                logger.error("API key is required to fetch alerts")
-                return []
-            
-            endpoint = f"{self.base_url}/get/alerts"
-            params = {"key": self.api_key, "format": "json"}
-            
-            logger.info(f"Fetching alerts from {endpoint}")
-            response = self.session.get(endpoint, params=params)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            # API returns a list of alerts directly
-            if isinstance(data, list):
-                alerts = data
-            else:
-                logger.warning(f"Unexpected response format: {type(data)}")
-                alerts = []
-            
-            logger.info(f"Retrieved {len(alerts)} alerts")
-            return alerts
-            
-        except requests.exceptions.HTTPError as e:
-            logger.error(f"HTTP error fetching alerts: {e.response.status_code} - {e}")
-            return []
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error fetching alerts: {e}")
-            return []
-        except ValueError as e:
-            logger.error(f"Error parsing alert response JSON: {e}")
-            return []
+        alerts = self._fetch_json("alerts")
+        logger.info("Retrieved %d alerts", len(alerts))
+        return alerts
+    
+    def get_snapshot(self) -> Dict[str, List[Dict]]:
+        """
+        Fetch events, cameras, and alerts concurrently
+        
+        The three requests share the pooled session, so total wall time is roughly
+        that of the slowest endpoint rather than the sum of all three.
+        
+        Returns:
+            Dictionary with 'events', 'cameras', and 'alerts' lists
+        """
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'events': executor.submit(self.get_events),
+                'cameras': executor.submit(self.get_cameras),
+                'alerts': executor.submit(self.get_alerts)
+            }
+            return {name: future.result() for name, future in futures.items()}
     
     def get_accidents(self, location: Optional[str] = None) -> List[Dict]:
         """
@@ -188,38 +426,79 @@ class ADOTClient:
             - LastUpdated (converted to Arizona local time)
         """
         try:
-            # Get all events (filtered by location if specified)
-            events = self.get_events(location=location)
+            events = self._fetch_json("events")
+            
+            # First pass: keep only accidents (eventType contains 'accident')
+            # Only these survivors are matched against the location and geocoded
+            accident_events = [event for event in events if is_accident(event)]
+            
+            if location:
+                accident_events = self._filter_by_location(accident_events, location)
+            
+            # Resolve every distinct coordinate pair in one batch
+            locations = self._geocode_all(
+                (event.get('Latitude'), event.get('Longitude')) for event in accident_events
+            )
             
-            # Filter for accidents and extract specific fields
+            # Second pass: project the accident fields, looking up resolved locations
+            convert_time = self._convert_unix_to_arizona_time
             accidents = []
-            for event in events:
-                event_type = event.get('EventType', '').lower()
-                
-                # Check if this is an accident (eventType contains 'accident')
-                if 'accident' in event_type:
-                    latitude = event.get('Latitude')
-                    longitude = event.get('Longitude')
-                    
-                    accident = {
-                        'Organization': event.get('Organization'),
-                        'RoadwayName': event.get('RoadwayName'),
-                        'DirectionOfTravel': event.get('DirectionOfTravel'),
-                        'Description': event.get('Description'),
-                        'LanesAffected': event.get('LanesAffected'),
-                        'Location': self._get_readable_location(latitude, longitude),
-                        'Reported': self._convert_unix_to_arizona_time(event.get('Reported')),
-                        'LastUpdated': self._convert_unix_to_arizona_time(event.get('LastUpdated'))
-                    }
-                    accidents.append(accident)
+            for event in accident_events:
+                accident = {field: event.get(field) for field in self.ACCIDENT_PASSTHROUGH_FIELDS}
+                accident['Location'] = locations.get((event.get('Latitude'), event.get('Longitude')))
+                accident['Reported'] = convert_time(event.get('Reported'))
+                accident['LastUpdated'] = convert_time(event.get('LastUpdated'))
+                accidents.append(accident)
             
-            logger.info(f"Retrieved {len(accidents)} accident events")
+            logger.info("Retrieved %d accident events", len(accidents))
             return accidents
             
         except Exception as e:
-            logger.error(f"Error fetching accidents: {e}")
+            logger.error("Error fetching accidents: %s", e)
             return []
     
+    def _geocode_all(self, coords: Iterable[Tuple[Optional[float], Optional[float]]]) -> Dict[Tuple, Optional[str]]:
+        """
+        Reverse geocode a batch of coordinates
+        
+        Cache hits are resolved immediately; only cache misses go to Nominatim,
+        paced by the rate limiter. Lookups against a self-hosted server run concurrently.
+        
+        Args:
+            coords: Iterable of (latitude, longitude) pairs, duplicates allowed
+            
+        Returns:
+            Dictionary mapping each distinct (latitude, longitude) pair to its readable location
+        """
+        unique_coords = dict.fromkeys(coords)
+        
+        # Coordinates in the same cache cell resolve to the same location, so look up each cell once
+        cells = {}
+        for latitude, longitude in unique_coords:
+            if latitude is not None and longitude is not None:
+                cells.setdefault(self._geocode_cache_key(latitude, longitude), (latitude, longitude))
+        
+        if self._self_hosted_geocoder and len(cells) > 1:
+            with ThreadPoolExecutor(max_workers=min(self.GEOCODE_WORKERS, len(cells))) as executor:
+                lookups = executor.map(lambda coord: self._lookup_location(*coord), cells.values())
+                resolved = dict(zip(cells, lookups))
+        else:
+            resolved = {cell: self._lookup_location(*coord) for cell, coord in cells.items()}
+        
+        for latitude, longitude in unique_coords:
+            if latitude is not None and longitude is not None:
+                # A failed cell lookup falls back to each point's own coordinates
+                readable = resolved[self._geocode_cache_key(latitude, longitude)]
+                unique_coords[(latitude, longitude)] = readable or f"{latitude}, {longitude}"
+        
+        logger.debug("Resolved %d coordinate pairs with %d location lookups", len(unique_coords), len(resolved))
+        return unique_coords
+    
+    @staticmethod
+    def _geocode_cache_key(latitude: float, longitude: float) -> Tuple[float, float]:
+        """Round coordinates to 4 decimal places (~11 m grid) so nearby reports share a location"""
+        return (round(latitude, 4), round(longitude, 4))
+    
     def _convert_unix_to_arizona_time(self, unix_timestamp: Optional[int]) -> Optional[str]:
         """
         Convert Unix timestamp to Arizona local time string
@@ -234,15 +513,10 @@ class ADOTClient:
             return None
         
         try:
-            # Convert Unix timestamp to datetime in Arizona timezone
-            arizona_tz = ZoneInfo('America/Phoenix')
-            dt = datetime.fromtimestamp(unix_timestamp, tz=arizona_tz)
-            
-            # Format as readable string
-            return dt.strftime('%Y-%m-%d %H:%M:%S %Z')
+            return _format_arizona_timestamp(unix_timestamp)
             
         except (ValueError, OSError) as e:
-            logger.warning(f"Error converting timestamp {unix_timestamp}: {e}")
+            logger.warning("Error converting timestamp %s: %s", unix_timestamp, e)
             return None
     
     def _get_readable_location(self, latitude: Optional[float], longitude: Optional[float]) -> Optional[str]:
@@ -259,53 +533,93 @@ class ADOTClient:
         if latitude is None or longitude is None:
             return None
         
-        try:
-            # Add small delay to respect Nominatim's usage policy (1 request per second)
-            time.sleep(1)
+        # Fallback to coordinates if no address found
+        return self._lookup_location(latitude, longitude) or f"{latitude}, {longitude}"
+    
+    def _lookup_location(self, latitude: float, longitude: float) -> Optional[str]:
+        """
+        Reverse geocode a coordinate pair through the cache and the rate limiter
+        
+        Failures are cached briefly as an empty string, not as coordinates, so other
+        points in the same cache cell still fall back to their own coordinates.
+        
+        Args:
+            latitude: Latitude coordinate
+            longitude: Longitude coordinate
             
-            location = self.geocoder.reverse(f"{latitude}, {longitude}", timeout=10)
+        Returns:
+            Intersection format string, or None if no address was found or geocoding failed
+        """
+        cache_key = self._geocode_cache_key(latitude, longitude)
+        cached = self._geo_cache.get(cache_key)
+        if cached is not None:
+            return cached or None
+        
+        try:
+            self._geocode_limiter.acquire()
+            try:
+                location = self.geocoder.reverse(f"{latitude}, {longitude}", timeout=10)
+            except GeocoderRateLimited as e:
+                self._geocode_limiter.on_throttled(e.retry_after)
+                raise
+            self._geocode_limiter.on_success()
+            readable = self._format_geocoded_location(location)
             
-            if location and location.raw:
-                address = location.raw.get('address', {})
-                
-                # Extract road names from address components
-                roads = []
-                
-                # Check for highway/interstate
-                if 'road' in address:
-                    roads.append(address['road'])
-                elif 'highway' in address:
-                    roads.append(address['highway'])
-                
-                # Add cross street if available
-                if 'street' in address and address['street'] not in roads:
-                    roads.append(address['street'])
-                
-                # Try other common road fields
-                for field in ['residential', 'suburb', 'neighbourhood']:
-                    if field in address and address[field] not in roads and len(roads) < 2:
-                        roads.append(address[field])
-                
-                # Format as intersection if we have roads
-                if len(roads) >= 2:
-                    return f"{roads[0]} and {roads[1]}"
-                elif len(roads) == 1:
-                    # If only one road, add city
-                    city = address.get('city') or address.get('town') or address.get('village', '')
-                    if city:
-                        return f"{roads[0]}, {city}"
-                    return roads[0]
-                else:
-                    # Fallback to full address if no roads found
-                    return location.address
-            else:
-                # Fallback to coordinates if no address found
-                return f"{latitude}, {longitude}"
+            if readable is not None:
+                self._geo_cache.set(cache_key, readable, expire=self.GEOCODE_CACHE_TTL)
+                return readable
                 
         except (GeocoderTimedOut, GeocoderServiceError) as e:
-            logger.warning(f"Geocoding error for {latitude}, {longitude}: {e}")
-            # Return coordinates as fallback
-            return f"{latitude}, {longitude}"
+            logger.warning("Geocoding error for %s, %s: %s", latitude, longitude, e)
         except Exception as e:
-            logger.error(f"Unexpected error during geocoding: {e}")
-            return f"{latitude}, {longitude}"
+            logger.error("Unexpected error during geocoding: %s", e)
+        
+        # Remember the failure briefly so repeated polls don't retry immediately
+        self._geo_cache.set(cache_key, "", expire=self.GEOCODE_FAILURE_TTL)
+        return None
+    
+    def _format_geocoded_location(self, location) -> Optional[str]:
+        """
+        Format a reverse geocoding result into intersection format
+        
+        Args:
+            location: geopy Location returned by reverse geocoding
+            
+        Returns:
+            Intersection format string (e.g., "I-10 and Broadway"), full address, or None if no result
+        """
+        if not location or not location.raw:
+            return None
+        
+        address = location.raw.get('address', {})
+        
+        # Extract road names from address components
+        roads = []
+        
+        # Check for highway/interstate
+        if 'road' in address:
+            roads.append(address['road'])
+        elif 'highway' in address:
+            roads.append(address['highway'])
+        
+        # Add cross street if available
+        if 'street' in address and address['street'] not in roads:
+            roads.append(address['street'])
+        
+        # Try other common road fields
+        for field in ['residential', 'suburb', 'neighbourhood']:
+            if field in address and address[field] not in roads and len(roads) < 2:
+                roads.append(address[field])
+        
+        # Format as intersection if we have roads
+        if len(roads) >= 2:
+            return f"{roads[0]} and {roads[1]}"
+        elif len(roads) == 1:
+            # If only one road, add city
+            city = address.get('city') or address.get('town') or address.get('village', '')
+            if city:
+                return f"{roads[0]}, {city}"
+            return roads[0]
+        
+        # Fallback to full address if no roads found
+        return location.address
@@ -0,0 +1,184 @@
+"""
+Message Formatters
+Turns ADOT 511 records into compact text messages for the Meshtastic network
+"""
+
+import logging
+import reprlib
+from datetime import datetime
+from functools import lru_cache
+from typing import Dict, Optional
+
+logger = logging.getLogger(__name__)
+
+# Bounded repr for alerts without a message text (never builds the full dict repr)
+_alert_repr = reprlib.Repr()
+_alert_repr.maxstring = 180
+_alert_repr.maxdict = 6
+_alert_repr.maxother = 60
+
+
+@lru_cache(maxsize=1)
+def arizona_tz():
+    """Arizona timezone (zoneinfo is only imported once a timestamp needs it)"""
+    from zoneinfo import ZoneInfo
+    return ZoneInfo('America/Phoenix')
+
+
+def parse_adot_timestamp(s: str) -> Optional[datetime]:
+    """
+    Parse an ADOT timestamp string (format: '2025-12-11 14:30:00 MST')
+    
+    Args:
+        s: Timestamp string
+        
+    Returns:
+        Timezone-aware datetime (Arizona time if the string has no offset), or None if unparseable
+    """
+    try:
+        # Fast path: read the fixed-position fields directly (Arizona time)
+        return datetime(
+            int(s[0:4]), int(s[5:7]), int(s[8:10]),
+            int(s[11:13]), int(s[14:16]), int(s[17:19]),
+            tzinfo=arizona_tz()
+        )
+    except (ValueError, IndexError):
+        pass
+    
+    # Slow path for anything unusual; only the rare odd record pays for dateutil
+    try:
+        from dateutil.parser import parse as _du_parse
+        dt = _du_parse(s, fuzzy=True)
+        return dt.replace(tzinfo=arizona_tz()) if dt.tzinfo is None else dt
+    except Exception:
+        return None
+
+
+def format_accident(
+    accident: Dict,
+    now: Optional[datetime] = None,
+    max_age_seconds: Optional[int] = None
+) -> str:
+    """
+    Format an accident dictionary into a concise message
+    
+    Args:
+        accident: Accident data dictionary
+        now: Current Arizona time; pass one value for a whole batch (default: read the clock)
+        max_age_seconds: Omit the elapsed time for updates older than this (default: no limit)
+        
+    Returns:
+        Formatted message string (will be split to 200 chars by sender)
+    """
+    roadway = accident.get('RoadwayName', 'Unknown road')
+    direction = accident.get('DirectionOfTravel', '')
+    lanes = accident.get('LanesAffected', '')
+    location = accident.get('Location', '')
+    last_updated_str = accident.get('LastUpdated', '')
+    
+    # Calculate elapsed time since last update
+    # (anything shorter than 'YYYY-MM-DD HH:MM:SS' can't be parsed, so skip it)
+    elapsed_str = ""
+    last_updated_dt = None
+    if last_updated_str and len(last_updated_str) >= 19:
+        last_updated_dt = parse_adot_timestamp(last_updated_str)
+    
+    if last_updated_dt is not None:
+        try:
+            # Get current time in Arizona timezone
+            if now is None:
+                now = datetime.now(arizona_tz())
+            
+            # Calculate elapsed time in whole seconds
+            elapsed_seconds = int(now.timestamp() - last_updated_dt.timestamp())
+            
+            # Format elapsed time, unless the update is too old to be interesting
+            if max_age_seconds is None or elapsed_seconds <= max_age_seconds:
+                hours, rem = divmod(elapsed_seconds, 3600)
+                minutes = rem // 60
+                
+                if hours > 0:
+                    elapsed_str = f"{hours}h{minutes}m ago"
+                else:
+                    elapsed_str = f"{minutes}m ago"
+        except Exception as e:
+            logger.warning("Error calculating elapsed time: %s", e)
+            elapsed_str = ""
+    
+    # Build compact message
+    return (
+        f"ACCIDENT: {roadway}"
+        f"{f' ({direction})' if direction else ''}"
+        f"{f' Lanes: {lanes}' if lanes and lanes != 'No Data' else ''}"
+        f"{f' @ {location}' if location else ''}"
+        f"{f' [{elapsed_str}]' if elapsed_str else ''}"
+    )
+
+
+def format_event(event: Dict, include_location: bool = True) -> str:
+    """
+    Format an event dictionary into a concise message
+    
+    Args:
+        event: Event data dictionary
+        include_location: Append "@ <location>" when the event has one (default: True)
+        
+    Returns:
+        Formatted message string (will be split to 200 chars by sender)
+    """
+    roadway = event.get('RoadwayName', 'Unknown road')
+    event_type = event.get('EventType', 'Event')
+    direction = event.get('DirectionOfTravel', '')
+    location = event.get('Location', '') if include_location else ''
+    
+    # Build compact message
+    return (
+        f"{event_type.upper()}: {roadway}"
+        f"{f' ({direction})' if direction else ''}"
+        f"{f' @ {location}' if location else ''}"
+    )
+
+
+def format_alert(alert: Dict) -> str:
+    """
+    Format an alert dictionary into a concise message
+    
+    Args:
+        alert: Alert data dictionary
+        
+    Returns:
+        Formatted message string (at most 200 characters)
+    """
+    message = alert.get('Message') if isinstance(alert, dict) else None
+    if message:
+        return f"ALERT: {message}"[:200]
+    
+    # Unknown structure: fall back to a size-bounded representation
+    return _alert_repr.repr(alert)[:200]
+
+
+def format_incident(incident: Dict) -> str:
+    """
+    Format an incident into a message string
+    
+    Args:
+        incident: Incident data dictionary
+        
+    Returns:
+        Formatted message string
+    """
+    # TODO: Customize formatting based on actual ADOT API response structure
+    location = incident.get('location', 'Unknown location')
+    description = incident.get('description', 'Traffic incident')
+    
+    try:
+        return _incident_text(location, description)
+    except TypeError:
+        # Unhashable field values (nested JSON) can't be cached
+        return f"ADOT Alert: {description} at {location}"
+
+
+@lru_cache(maxsize=1024)
+def _incident_text(location: str, description: str) -> str:
+    """Build the incident message (cached: the same incidents repeat across polls)"""
+    return f"ADOT Alert: {description} at {location}"
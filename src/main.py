@@ -3,17 +3,52 @@ ADOT 511 to Meshtastic Integration
 Main entry point for the application
 """
 
-import argparse
+import importlib.util
 import logging
 import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
 from datetime import datetime
-from zoneinfo import ZoneInfo
-from dotenv import load_dotenv
-from .adot_client import ADOTClient
-from .meshtastic_sender import MeshtasticSender
+from types import ModuleType
+from typing import TYPE_CHECKING, Optional
+from .adot_client import ADOTClient, is_accident
+from .formatters import arizona_tz, format_accident, format_event
 
-# Load environment variables from .env file
-load_dotenv()
+if TYPE_CHECKING:
+    import argparse
+    from .meshtastic_listener import MeshtasticListener
+    from .meshtastic_sender import MeshtasticSender
+
+
+def _lazy_import(name: str) -> ModuleType:
+    """
+    Register a module whose code only runs on first attribute access
+    
+    Args:
+        name: Module name, relative to this package (e.g., ".meshtastic_listener")
+        
+    Returns:
+        Module object (loaded on first use)
+    """
+    absolute_name = importlib.util.resolve_name(name, __package__)
+    if absolute_name in sys.modules:
+        return sys.modules[absolute_name]
+    
+    spec = importlib.util.find_spec(absolute_name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[absolute_name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Only listen mode needs the listener, and only sending needs the sender (which pulls
+# in meshtastic); debug-mode one-shot queries never trigger either import
+_meshtastic_listener = _lazy_import('.meshtastic_listener')
+_meshtastic_sender = _lazy_import('.meshtastic_sender')
 
 # Configure logging
 logging.basicConfig(
@@ -24,74 +59,149 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def _format_accident_message(accident: dict) -> str:
+# Console framing for debug-mode output
+_BANNER = "=" * 60
+_BANNER_TOP = "\n" + _BANNER
+_BANNER_BOT = _BANNER + "\n"
+
+_VALID_SEARCH_TYPES: frozenset[str] = frozenset({'accidents', 'events', 'alerts', 'weather', 'listen'})
+_VALID_SEARCH_TYPES_STR = ', '.join(sorted(_VALID_SEARCH_TYPES))
+
+_ENV_LOADED = False
+
+
+def _ensure_dotenv_loaded():
+    """Load environment variables from the .env file (only once per process)"""
+    global _ENV_LOADED
+    if not _ENV_LOADED:
+        from dotenv import load_dotenv
+        load_dotenv()
+        _ENV_LOADED = True
+
+
+def _env_int(env, name: str, default: Optional[int]) -> Optional[int]:
     """
-    Format an accident dictionary into a concise message for Meshtastic
+    Read an integer setting from the environment
     
     Args:
-        accident: Accident data dictionary
+        env: Environment mapping
+        name: Variable name
+        default: Value when the variable is unset or empty
         
     Returns:
-        Formatted message string (will be truncated to 200 chars by sender)
+        Parsed integer, or the default
+        
+    Raises:
+        ValueError: If the value is not an integer (the message names the variable)
     """
-    roadway = accident.get('RoadwayName', 'Unknown road')
-    direction = accident.get('DirectionOfTravel', '')
-    lanes = accident.get('LanesAffected', '')
-    location = accident.get('Location', '')
-    last_updated_str = accident.get('LastUpdated', '')
-    
-    # Calculate elapsed time since last update
-    elapsed_str = ""
-    if last_updated_str:
-        try:
-            # Parse the timestamp string (format: '2025-12-11 14:30:00 MST')
-            # Remove timezone abbreviation for parsing
-            timestamp_without_tz = ' '.join(last_updated_str.split()[:-1])
-            last_updated_dt = datetime.strptime(timestamp_without_tz, '%Y-%m-%d %H:%M:%S')
-            
-            # Make it timezone-aware (Arizona time)
-            arizona_tz = ZoneInfo('America/Phoenix')
-            last_updated_dt = last_updated_dt.replace(tzinfo=arizona_tz)
-            
-            # Get current time in Arizona timezone
-            now = datetime.now(arizona_tz)
-            
-            # Calculate elapsed time
-            elapsed = now - last_updated_dt
-            
-            # Format elapsed time
-            hours = int(elapsed.total_seconds() // 3600)
-            minutes = int((elapsed.total_seconds() % 3600) // 60)
-            
-            if hours > 0:
-                elapsed_str = f"{hours}h{minutes}m ago"
-            else:
-                elapsed_str = f"{minutes}m ago"
-        except Exception as e:
-            logger.warning(f"Error calculating elapsed time: {e}")
-            elapsed_str = ""
-    
-    # Build compact message
-    parts = [f"ACCIDENT: {roadway}"]
-    
-    if direction:
-        parts.append(f"({direction})")
+    value = env.get(name)
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        raise ValueError(f"{name} must be an integer, got {value!r}") from None
+
+
+@dataclass(frozen=True)
+class Config:
+    """Application settings read from environment variables"""
     
-    if lanes and lanes != "No Data":
-        parts.append(f"Lanes: {lanes}")
+    adot_api_key: Optional[str]
+    connection_type: str
+    device_path: Optional[str]
+    tcp_host: Optional[str]
+    tcp_port: int
+    channel_index: int
+    max_results: int
+    enable_send: bool
+    want_ack: bool
+    nominatim_url: Optional[str]
+    elapsed_max_hours: int
+    cache_ttl_secs: Optional[int]
     
-    if location:
-        parts.append(f"@ {location}")
+    @classmethod
+    def from_env(cls) -> "Config":
+        """
+        Build the configuration from the environment (and .env file)
+        
+        Returns:
+            Populated Config instance
+        """
+        _ensure_dotenv_loaded()
+        env = os.environ
+        return cls(
+            adot_api_key=env.get("ADOT_API_KEY"),
+            connection_type=env.get("MESHTASTIC_CONNECTION_TYPE", "serial"),
+            device_path=env.get("MESHTASTIC_DEVICE_PATH"),
+            tcp_host=env.get("MESHTASTIC_TCP_HOST"),
+            tcp_port=_env_int(env, "MESHTASTIC_TCP_PORT", 4403),
+            channel_index=_env_int(env, "MESHTASTIC_CHANNEL_INDEX", 0),
+            max_results=_env_int(env, "MAX_RESULTS_PER_QUERY", 3),
+            enable_send=env.get("ENABLE_MESHTASTIC_SEND", "false").lower() == "true",
+            want_ack=env.get("MESHTASTIC_WANT_ACK", "true").lower() == "true",
+            nominatim_url=env.get("NOMINATIM_URL"),
+            elapsed_max_hours=_env_int(env, "ADOT_ELAPSED_MAX_HOURS", 48),
+            cache_ttl_secs=_env_int(env, "ADOT_CACHE_TTL_SECS", None)
+        )
+
+
+def _make_mesh_sender(cfg: Config) -> "MeshtasticSender":
+    """
+    Create a Meshtastic sender from the connection settings
     
-    if elapsed_str:
-        parts.append(f"[{elapsed_str}]")
+    Args:
+        cfg: Application configuration
+        
+    Returns:
+        Connected MeshtasticSender
+    """
+    logger.info("Initializing Meshtastic with %s connection on channel %d", cfg.connection_type, cfg.channel_index)
+    return _meshtastic_sender.MeshtasticSender(
+        device_path=cfg.device_path,
+        tcp_host=cfg.tcp_host,
+        tcp_port=cfg.tcp_port,
+        connection_type=cfg.connection_type,
+        channel_index=cfg.channel_index,
+        want_ack=cfg.want_ack
+    )
+
+
+def _make_listener(cfg: Config) -> "MeshtasticListener":
+    """
+    Create a Meshtastic listener from the connection and query settings
     
-    return " ".join(parts)
+    Args:
+        cfg: Application configuration
+        
+    Returns:
+        MeshtasticListener ready to start
+    """
+    return _meshtastic_listener.MeshtasticListener(
+        adot_api_key=cfg.adot_api_key,
+        device_path=cfg.device_path,
+        tcp_host=cfg.tcp_host,
+        tcp_port=cfg.tcp_port,
+        connection_type=cfg.connection_type,
+        channel_index=cfg.channel_index,
+        max_results=cfg.max_results,
+        nominatim_url=cfg.nominatim_url,
+        want_ack=cfg.want_ack,
+        elapsed_max_hours=cfg.elapsed_max_hours,
+        cache_ttl_secs=cfg.cache_ttl_secs
+    )
 
 
-def main():
-    """Main execution function"""
-    # Parse command-line arguments
+def _print_banner(message: str):
+    """Print a message framed by banner lines (debug mode output)"""
+    sys.stdout.write(f"{_BANNER_TOP}\n{message}\n{_BANNER_BOT}\n")
+
+
+@lru_cache(maxsize=1)
+def _get_parser() -> "argparse.ArgumentParser":
+    """Build the command-line parser (once per process)"""
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='ADOT 511 to Meshtastic Integration',
         formatter_class=argparse.RawDescriptionHelpFormatter
@@ -108,8 +218,13 @@ def main():
         default='phoenix',
         help='Location to search (default: phoenix). Use "all" to retrieve all results without filtering.'
     )
-    
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main execution function"""
+    # Parse command-line arguments
+    args = _get_parser().parse_args()
     
     # Make parameters case-insensitive
     search_type = args.search_type.lower()
@@ -120,9 +235,15 @@ def main():
         location = None
     
     # Validate search type
-    valid_search_types = ['accidents', 'events', 'alerts', 'weather', 'listen']
-    if search_type not in valid_search_types:
-        logger.error(f"Invalid search type '{search_type}'. Must be one of: {', '.join(valid_search_types)}")
+    if search_type not in _VALID_SEARCH_TYPES:
+        logger.error("Invalid search type '%s'. Must be one of: %s", search_type, _VALID_SEARCH_TYPES_STR)
+        return
+    
+    # Read all settings from the environment once
+    try:
+        cfg = Config.from_env()
+    except ValueError as e:
+        logger.error("Invalid configuration: %s", e)
         return
     
     # Handle listen mode
@@ -136,128 +257,111 @@ def main():
         logging.getLogger('geopy').setLevel(logging.WARNING)
         
         logger.info("Starting Meshtastic listener mode...")
-        from .meshtastic_listener import MeshtasticListener
         
-        # Get API key from environment variable
-        adot_api_key = os.getenv("ADOT_API_KEY")
-        if not adot_api_key:
+        if not cfg.adot_api_key:
             logger.error("ADOT_API_KEY environment variable not set")
             raise ValueError("ADOT_API_KEY is required")
         
-        # Get Meshtastic connection settings from environment variables
-        connection_type = os.getenv("MESHTASTIC_CONNECTION_TYPE", "serial")
-        device_path = os.getenv("MESHTASTIC_DEVICE_PATH")
-        tcp_host = os.getenv("MESHTASTIC_TCP_HOST")
-        tcp_port = int(os.getenv("MESHTASTIC_TCP_PORT", "4403"))
-        channel_index = int(os.getenv("MESHTASTIC_CHANNEL_INDEX", "0"))
-        max_results = int(os.getenv("MAX_RESULTS_PER_QUERY", "3"))
-        
         # Initialize and start listener
-        listener = MeshtasticListener(
-            adot_api_key=adot_api_key,
-            device_path=device_path,
-            tcp_host=tcp_host,
-            tcp_port=tcp_port,
-            connection_type=connection_type,
-            channel_index=channel_index,
-            max_results=max_results
-        )
+        listener = _make_listener(cfg)
         
         # Start listening (this will block until interrupted)
         listener.start()
         return
     
-    logger.info(f"Starting ADOT 511 to Meshtastic integration - Search Type: {search_type}, Location: {location if location else 'all'}")
+    logger.info("Starting ADOT 511 to Meshtastic integration - Search Type: %s, Location: %s", search_type, location if location else 'all')
     
+    adot_client = None
+    mesh_sender = None
     try:
-        # Get API key from environment variable
-        adot_api_key = os.getenv("ADOT_API_KEY")
-        if not adot_api_key:
+        if not cfg.adot_api_key:
             logger.error("ADOT_API_KEY environment variable not set")
             raise ValueError("ADOT_API_KEY is required")
         
         # Initialize ADOT API client
-        adot_client = ADOTClient(api_key=adot_api_key)
+        adot_client = ADOTClient(
+            api_key=cfg.adot_api_key,
+            nominatim_url=cfg.nominatim_url,
+            response_cache_ttl=cfg.cache_ttl_secs
+        )
         
         # Check if Meshtastic sending is enabled
-        enable_send = os.getenv("ENABLE_MESHTASTIC_SEND", "false").lower() == "true"
+        enable_send = cfg.enable_send
         
         if not enable_send:
             print("\n[DEBUG] Initialized ADOT API client")
-        mesh_sender = None
-        
-        if enable_send:
-            # Get Meshtastic connection settings from environment variables
-            connection_type = os.getenv("MESHTASTIC_CONNECTION_TYPE", "serial")
-            device_path = os.getenv("MESHTASTIC_DEVICE_PATH")
-            tcp_host = os.getenv("MESHTASTIC_TCP_HOST")
-            tcp_port = int(os.getenv("MESHTASTIC_TCP_PORT", "4403"))
-            channel_index = int(os.getenv("MESHTASTIC_CHANNEL_INDEX", "0"))
-            
-            # Initialize Meshtastic sender
-            logger.info(f"Initializing Meshtastic with {connection_type} connection on channel {channel_index}")
-            mesh_sender = MeshtasticSender(
-                device_path=device_path,
-                tcp_host=tcp_host,
-                tcp_port=tcp_port,
-                connection_type=connection_type,
-                channel_index=channel_index
-            )
-        else:
-            logger.info("DEBUG MODE: Meshtastic sending is disabled")
         
         # Fetch data from ADOT API
         location_str = location if location else 'all locations'
-        logger.info(f"Fetching {search_type} data from ADOT 511 API for {location_str}...")
+        logger.info("Fetching %s data from ADOT 511 API for %s...", search_type, location_str)
         if not enable_send:
             print(f"[DEBUG] Fetching {search_type} from ADOT 511 API for {location_str}...")
         
-        # Fetch data based on search type
+        # Start the fetch in the background so it overlaps with connecting to the radio
+        fetchers = {
+            'accidents': adot_client.get_accidents,
+            'events': adot_client.get_events
+        }
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            fetch_future = None
+            if search_type in fetchers:
+                fetch_future = executor.submit(fetchers[search_type], location=location)
+            
+            if enable_send:
+                mesh_sender = _make_mesh_sender(cfg)
+            else:
+                logger.info("DEBUG MODE: Meshtastic sending is disabled")
+            
+            fetched = fetch_future.result() if fetch_future else None
+        
+        # Process data based on search type
         if search_type == 'accidents':
-            # Fetch accidents
-            accidents = adot_client.get_accidents(location=location)
+            accidents = fetched
             
             if not enable_send:
                 print(f"[DEBUG] Retrieved {len(accidents)} accidents")
             
             # Process and send accidents to Meshtastic
             if accidents:
-                logger.info(f"Found {len(accidents)} accidents")
+                logger.info("Found %d accidents", len(accidents))
                 if not enable_send:
                     print(f"[DEBUG] Processing {len(accidents)} accidents...\n")
                 
-                # Track seen accidents to avoid duplicates
-                seen_accidents = set()
-                processed_count = 0
-                
+                # Deduplicate accidents, keeping the first occurrence of each unique key
+                # (methods bound to locals to skip attribute lookups in the loop)
+                unique_accidents = {}
+                dget = dict.get
+                keep_first = unique_accidents.setdefault
                 for accident in accidents:
-                    # Create unique key from accident details
+                    # Most selective field first, so key comparisons on hash
+                    # collisions usually stop at the first element
                     accident_key = (
-                        accident.get('RoadwayName', ''),
-                        accident.get('DirectionOfTravel', ''),
-                        accident.get('Location', ''),
-                        accident.get('LastUpdated', '')
+                        dget(accident, 'LastUpdated', ''),
+                        dget(accident, 'Location', ''),
+                        dget(accident, 'DirectionOfTravel', ''),
+                        dget(accident, 'RoadwayName', '')
                     )
-                    
-                    # Skip if we've already seen this accident
-                    if accident_key in seen_accidents:
-                        continue
-                    
-                    seen_accidents.add(accident_key)
-                    processed_count += 1
-                    
-                    # Format accident message
-                    message = _format_accident_message(accident)
-                    
-                    if enable_send:
-                        # Send to Meshtastic
-                        logger.info(f"Sending message: {message}")
-                        mesh_sender.send_message(message)
-                    else:
-                        # Print to console instead
-                        print(f"\n{'='*60}")
-                        print(f"{message}")
-                        print(f"{'='*60}\n")
+                    keep_first(accident_key, accident)
+                processed_count = len(unique_accidents)
+                
+                # Format accident messages (one clock read for the whole batch)
+                now = datetime.now(arizona_tz())
+                max_age_seconds = cfg.elapsed_max_hours * 3600
+                fmt = format_accident
+                messages = [
+                    fmt(accident, now, max_age_seconds)
+                    for accident in unique_accidents.values()
+                ]
+                
+                if enable_send:
+                    # Send to Meshtastic, packing short messages into shared frames
+                    for message in messages:
+                        logger.info("Sending message: %s", message)
+                    mesh_sender.send_messages(messages)
+                else:
+                    # Print to console instead
+                    for message in messages:
+                        _print_banner(message)
                 
                 if not enable_send and len(accidents) != processed_count:
                     print(f"[DEBUG] Skipped {len(accidents) - processed_count} duplicate accidents")
@@ -267,81 +371,65 @@ def main():
                 if enable_send:
                     mesh_sender.send_message(message)
                 else:
-                    print(f"\n{'='*60}")
-                    print(f"{message}")
-                    print(f"{'='*60}\n")
+                    _print_banner(message)
         elif search_type == 'events':
-            # Fetch all events
-            events = adot_client.get_events(location=location)
+            events = fetched
             
-            # Filter out accidents and incidents (use 'accidents' search type for those)
-            non_accident_events = [
-                event for event in events 
-                if 'accident' not in event.get('EventType', '').lower()
-            ]
+            # In one pass, filter out accidents (use 'accidents' search type for those)
+            # and deduplicate the rest, keeping the first occurrence of each unique key
+            # (methods bound to locals to skip attribute lookups in the loop)
+            unique_events = {}
+            accident_count = 0
+            dget = dict.get
+            keep_first = unique_events.setdefault
+            for event in events:
+                if is_accident(event):
+                    accident_count += 1
+                    continue
+                # Most selective field first (see accidents above)
+                event_key = (
+                    dget(event, 'Location', ''),
+                    dget(event, 'DirectionOfTravel', ''),
+                    dget(event, 'EventType', ''),
+                    dget(event, 'RoadwayName', '')
+                )
+                keep_first(event_key, event)
+            non_accident_count = len(events) - accident_count
             
             if not enable_send:
-                print(f"[DEBUG] Retrieved {len(non_accident_events)} events (filtered out {len(events) - len(non_accident_events)} accidents)")
+                print(f"[DEBUG] Retrieved {non_accident_count} events (filtered out {accident_count} accidents)")
             
             # Process and send events to Meshtastic
-            if non_accident_events:
-                logger.info(f"Found {len(non_accident_events)} events")
+            if unique_events:
+                logger.info("Found %d events", non_accident_count)
                 if not enable_send:
-                    print(f"[DEBUG] Processing {len(non_accident_events)} events...\n")
+                    print(f"[DEBUG] Processing {non_accident_count} events...\n")
                 
-                # Track seen events to avoid duplicates
-                seen_events = set()
-                processed_count = 0
+                processed_count = len(unique_events)
                 
-                for event in non_accident_events:
-                    # Create unique key from event details
-                    event_key = (
-                        event.get('RoadwayName', ''),
-                        event.get('EventType', ''),
-                        event.get('DirectionOfTravel', ''),
-                        event.get('Location', '')
-                    )
-                    
-                    # Skip if we've already seen this event
-                    if event_key in seen_events:
-                        continue
-                    
-                    seen_events.add(event_key)
-                    processed_count += 1
-                    
-                    # Format event message
-                    roadway = event.get('RoadwayName', 'Unknown road')
-                    event_type = event.get('EventType', 'Event')
-                    direction = event.get('DirectionOfTravel', '')
-                    
-                    # Build compact message
-                    parts = [f"{event_type.upper()}: {roadway}"]
-                    if direction:
-                        parts.append(f"({direction})")
-                    
-                    message = " ".join(parts)
-                    
-                    if enable_send:
-                        # Send to Meshtastic
-                        logger.info(f"Sending message: {message}")
-                        mesh_sender.send_message(message)
-                    else:
-                        # Print to console instead
-                        print(f"\n{'='*60}")
-                        print(f"{message}")
-                        print(f"{'='*60}\n")
+                # Format all event messages before any radio I/O starts
+                fmt = format_event
+                messages = [fmt(event, include_location=False) for event in unique_events.values()]
+                
+                if enable_send:
+                    # Send to Meshtastic, packing short messages into shared frames
+                    for message in messages:
+                        logger.info("Sending message: %s", message)
+                    mesh_sender.send_messages(messages)
+                else:
+                    # Print to console instead
+                    for message in messages:
+                        _print_banner(message)
                 
-                if not enable_send and len(non_accident_events) != processed_count:
-                    print(f"[DEBUG] Skipped {len(non_accident_events) - processed_count} duplicate events")
+                if not enable_send and non_accident_count != processed_count:
+                    print(f"[DEBUG] Skipped {non_accident_count - processed_count} duplicate events")
             else:
                 message = "No events found"
                 logger.info(message)
                 if enable_send:
                     mesh_sender.send_message(message)
                 else:
-                    print(f"\n{'='*60}")
-                    print(f"{message}")
-                    print(f"{'='*60}\n")
+                    _print_banner(message)
         elif search_type == 'alerts':
             logger.info("Alerts search not yet implemented")
             print("[INFO] Alerts search not yet implemented")
@@ -350,8 +438,13 @@ def main():
             print("[INFO] Weather search not yet implemented")
             
     except Exception as e:
-        logger.error(f"Error in main execution: {e}", exc_info=True)
+        logger.error("Error in main execution: %s", e, exc_info=True)
         raise
+    finally:
+        if adot_client:
+            adot_client.close()
+        if mesh_sender:
+            mesh_sender.close()
 
 
 if __name__ == "__main__":
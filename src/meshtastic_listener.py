@@ -6,14 +6,33 @@ Listens for commands on Meshtastic network and responds with ADOT data
 import logging
 import re
 import os
+import sys
+import threading
 from typing import Optional, Callable
 from datetime import datetime
-from zoneinfo import ZoneInfo
-from .adot_client import ADOTClient
+from itertools import filterfalse, islice
+import meshtastic.serial_interface as _mser
+import meshtastic.tcp_interface as _mtcp
+import pubsub.pub as _pubsub
+from .adot_client import ADOTClient, is_accident
+from .formatters import arizona_tz, format_accident, format_alert, format_event
 from .meshtastic_sender import MeshtasticSender
 
 logger = logging.getLogger(__name__)
 
+# Interstate references like I10, i10, I-10, i-10 (with or without dash)
+# Captures: (I or i)(optional dash)(numbers)
+_INTERSTATE_RE = re.compile(r'\b([Ii])(-?)(\d+)\b')
+_INTERSTATE_SUB = _INTERSTATE_RE.sub
+
+# First words that can start a command (checked before running COMMAND_PATTERN)
+_COMMANDS = frozenset(('accidents', 'events', 'alerts', 'weather'))
+
+# Log framing
+_BANNER = "=" * 70
+_NL_BANNER = "\n" + _BANNER
+_BANNER_NL = _BANNER + "\n"
+
 
 class MeshtasticListener:
     """Listener for Meshtastic messages that processes ADOT data requests"""
@@ -32,7 +51,11 @@ class MeshtasticListener:
         tcp_port: int = 4403,
         connection_type: str = "serial",
         channel_index: int = 0,
-        max_results: int = 3
+        max_results: int = 3,
+        nominatim_url: Optional[str] = None,
+        want_ack: bool = True,
+        elapsed_max_hours: int = 48,
+        cache_ttl_secs: Optional[int] = None
     ):
         """
         Initialize Meshtastic listener
@@ -45,37 +68,60 @@ class MeshtasticListener:
             connection_type: Connection type - "serial" or "tcp" (default: "serial")
             channel_index: Channel index to listen on (default: 0)
             max_results: Maximum number of results to return per query (default: 3)
+            nominatim_url: Optional base URL of a self-hosted Nominatim server for geocoding
+            want_ack: Request ACKs for replies and wait for them (default: True)
+            elapsed_max_hours: Omit the elapsed time for accidents last updated longer ago (default: 48)
+            cache_ttl_secs: Seconds to reuse cached events/alerts responses (default: client default)
         """
-        self.adot_client = ADOTClient(api_key=adot_api_key)
+        self.adot_client = ADOTClient(
+            api_key=adot_api_key,
+            nominatim_url=nominatim_url,
+            response_cache_ttl=cache_ttl_secs
+        )
         self.mesh_sender = MeshtasticSender(
             device_path=device_path,
             tcp_host=tcp_host,
             tcp_port=tcp_port,
             connection_type=connection_type,
-            channel_index=channel_index
+            channel_index=channel_index,
+            want_ack=want_ack
         )
         self.channel_index = channel_index
         self.max_results = max_results
-        self.interface = None
+        self.max_age_seconds = elapsed_max_hours * 3600
         self.running = False
+        self._stop_event = threading.Event()
+        self._my_node_num = None
+        self._handlers = {
+            'accidents': self._handle_accidents_command,
+            'events': self._handle_events_command,
+            'alerts': self._handle_alerts_command,
+            'weather': self._handle_weather_command
+        }
         
-        logger.info(f"MeshtasticListener initialized on channel {channel_index}")
+        logger.info("MeshtasticListener initialized on channel %s", channel_index)
+    
+    @property
+    def interface(self):
+        """The sender's current interface (the sender replaces it when it reconnects)"""
+        return self.mesh_sender.interface
     
     def start(self):
         """Start listening for messages"""
         try:
-            logger.info("=" * 70)
-            logger.info("Starting Meshtastic listener...")
-            logger.info(f"Connection type: {self.mesh_sender.connection_type}")
-            logger.info(f"Channel index: {self.channel_index}")
-            logger.info(f"Max results per query: {self.max_results}")
-            
-            if self.mesh_sender.connection_type == "tcp":
-                logger.info(f"TCP host: {self.mesh_sender.tcp_host}:{self.mesh_sender.tcp_port}")
-            elif self.mesh_sender.connection_type == "serial":
-                logger.info(f"Serial device: {self.mesh_sender.device_path}")
-            
-            logger.info("=" * 70)
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_BANNER)
+                logger.info("Starting Meshtastic listener...")
+                logger.info("Connection type: %s", self.mesh_sender.connection_type)
+                logger.info("Channel index: %s", self.channel_index)
+                logger.info("Max results per query: %s", self.max_results)
+                
+                if self.mesh_sender.connection_type == "tcp":
+                    logger.info("TCP host: %s:%s", self.mesh_sender.tcp_host, self.mesh_sender.tcp_port)
+                elif self.mesh_sender.connection_type == "serial":
+                    logger.info("Serial device: %s", self.mesh_sender.device_path)
+                
+                logger.info(_BANNER)
             self.running = True
             
             # Temporarily enable meshtastic debug to see what's happening
@@ -85,71 +131,73 @@ class MeshtasticListener:
             
             # Initialize meshtastic interface and set up message callback
             logger.info("Connecting to Meshtastic device...")
-            if self.mesh_sender.connection_type == "tcp" and self.mesh_sender.tcp_host:
-                import meshtastic.tcp_interface
-                self.interface = meshtastic.tcp_interface.TCPInterface(
-                    hostname=self.mesh_sender.tcp_host,
-                    portNumber=self.mesh_sender.tcp_port,
-                    connectNow=True
-                )
-            elif self.mesh_sender.connection_type == "serial" and self.mesh_sender.device_path:
-                import meshtastic.serial_interface
-                self.interface = meshtastic.serial_interface.SerialInterface(
-                    devPath=self.mesh_sender.device_path
-                )
-            else:
-                import meshtastic.serial_interface
-                self.interface = meshtastic.serial_interface.SerialInterface()
+            # The sender owns the connection; reuse it instead of opening a second one
+            # to the device, and read it back through the sender from now on
+            if self.mesh_sender.interface is None:
+                if self.mesh_sender.connection_type == "tcp" and self.mesh_sender.tcp_host:
+                    interface = _mtcp.TCPInterface(
+                        hostname=self.mesh_sender.tcp_host,
+                        portNumber=self.mesh_sender.tcp_port,
+                        connectNow=True
+                    )
+                elif self.mesh_sender.connection_type == "serial" and self.mesh_sender.device_path:
+                    interface = _mser.SerialInterface(
+                        devPath=self.mesh_sender.device_path
+                    )
+                else:
+                    interface = _mser.SerialInterface()
+                
+                # Share the interface with the sender so it can actually send messages
+                self.mesh_sender.interface = interface
+                logger.info("Interface shared with message sender")
             
             logger.info("Meshtastic connection established!")
             
-            # Share the interface with the sender so it can actually send messages
-            self.mesh_sender.interface = self.interface
-            logger.info("Interface shared with message sender")
+            # Remember our node number so echoed messages can be recognized per packet cheaply
+            self._my_node_num = getattr(getattr(self.interface, 'myInfo', None), 'my_node_num', None)
             
             # Set up message callback - pubsub is the correct way for meshtastic library
-            import pubsub.pub
-            
             def on_receive(packet, interface):
-                logger.info("[CALLBACK TRIGGERED] Received a packet")
+                logger.debug("[CALLBACK TRIGGERED] Received a packet")
                 self._on_message_received(packet, interface)
             
             # Subscribe to receive events using pubsub
             logger.info("Setting up message callback via pubsub...")
-            pubsub.pub.subscribe(on_receive, "meshtastic.receive")
+            _pubsub.subscribe(on_receive, "meshtastic.receive")
             logger.info("Subscribed to meshtastic.receive messages")
             
-            logger.info("\n" + "=" * 70)
-            logger.info("LISTENER READY - Monitoring for messages...")
-            logger.info("=" * 70)
-            logger.info(f"Listening ONLY on channel: {self.channel_index}")
-            logger.info("Filtering: TEXT_MESSAGE_APP only (ignoring nodeinfo, telemetry, etc.)")
-            logger.info("=" * 70)
-            logger.info("Supported commands: 'accidents <location>', 'events <location>'")
-            logger.info("Example: 'accidents 101' or 'events phoenix'")
-            logger.info("=" * 70)
-            logger.info("Text messages on the configured channel will appear below")
-            logger.info("=" * 70 + "\n")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(_NL_BANNER)
+                logger.info("LISTENER READY - Monitoring for messages...")
+                logger.info(_BANNER)
+                logger.info("Listening ONLY on channel: %s", self.channel_index)
+                logger.info("Filtering: TEXT_MESSAGE_APP only (ignoring nodeinfo, telemetry, etc.)")
+                logger.info(_BANNER)
+                logger.info("Supported commands: 'accidents <location>', 'events <location>'")
+                logger.info("Example: 'accidents 101' or 'events phoenix'")
+                logger.info(_BANNER)
+                logger.info("Text messages on the configured channel will appear below")
+                logger.info(_BANNER_NL)
             
-            # Keep the listener running
-            # In production, this would be handled by the meshtastic library's event loop
-            # For now, we'll use a simple loop
-            import time
-            while self.running:
-                time.sleep(1)
+            # Block until stop() is called; packets are handled on the meshtastic reader thread.
+            # Windows can't interrupt an untimed wait with Ctrl+C, so poll there instead.
+            wait_timeout = 1.0 if sys.platform == 'win32' else None
+            while not self._stop_event.wait(wait_timeout):
+                pass
                 
         except KeyboardInterrupt:
             logger.info("Listener stopped by user")
             self.stop()
         except Exception as e:
-            logger.error(f"Error starting listener: {e}", exc_info=True)
+            logger.error("Error starting listener: %s", e, exc_info=True)
             self.stop()
     
     def stop(self):
         """Stop listening for messages"""
         self.running = False
-        if self.interface:
-            self.interface.close()
+        self._stop_event.set()
+        # Closes whichever interface the sender holds now, after any queued sends
+        self.mesh_sender.close()
         logger.info("Listener stopped")
     
     def _on_message_received(self, packet, interface):
@@ -161,54 +209,49 @@ class MeshtasticListener:
             interface: Meshtastic interface object
         """
         try:
-            # Check if packet has decoded data
-            if 'decoded' not in packet:
-                # Silently ignore packets without decoded field (ACKs, etc.)
-                return
+            get = packet.get
             
-            # Check portnum - only process TEXT_MESSAGE_APP
-            portnum = packet['decoded'].get('portnum', '')
-            if portnum != 'TEXT_MESSAGE_APP':
-                # Silently ignore non-text packets (telemetry, nodeinfo, etc.)
+            # Only process TEXT_MESSAGE_APP; silently ignore packets without decoded
+            # data (ACKs, etc.) and non-text packets (telemetry, nodeinfo, etc.)
+            decoded = get('decoded')
+            if decoded is None or decoded.get('portnum') != 'TEXT_MESSAGE_APP':
                 return
             
             # Check if message is on the configured channel
-            packet_channel = packet.get('channel', 0)
+            packet_channel = get('channel', 0)
             if packet_channel != self.channel_index:
-                logger.debug(f"[DEBUG] Ignoring message from channel {packet_channel} (listening on channel {self.channel_index})")
+                logger.debug("Ignoring message from channel %s (listening on channel %s)", packet_channel, self.channel_index)
                 return
             
             # Check for text message
-            if 'text' not in packet['decoded']:
-                logger.debug(f"[DEBUG] No 'text' field in decoded data - skipping")
+            message_text = decoded.get('text')
+            if message_text is None:
+                logger.debug("No 'text' field in decoded data - skipping")
                 return
             
-            message_text = packet['decoded']['text']
-            sender_id = packet.get('from', 'Unknown')
-            to_id = packet.get('to', 'Unknown')
+            sender_id = get('from', 'Unknown')
+            to_id = get('to', 'Unknown')
             
             # Check if this is a message we sent (echo back from the radio)
             # We can identify our own messages by checking if sender is our node
-            is_our_message = False
-            if hasattr(self.interface, 'myInfo') and self.interface.myInfo:
-                our_node_num = self.interface.myInfo.my_node_num
-                is_our_message = (sender_id == our_node_num)
+            is_our_message = (self._my_node_num is not None and sender_id == self._my_node_num)
             
-            # Always log received messages that pass the filters
-            logger.info("=" * 70)
-            if is_our_message:
-                logger.info(f"[OUR MESSAGE ECHOED] From: {sender_id}, To: {to_id}, Channel: {packet_channel}")
-            else:
-                logger.info(f"[MESSAGE RECEIVED] From: {sender_id}, To: {to_id}, Channel: {packet_channel}")
-            logger.info(f"[MESSAGE CONTENT] '{message_text}'")
-            logger.info("=" * 70)
+            # Log received messages that pass the filters (per-packet, so DEBUG level)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(_BANNER)
+                if is_our_message:
+                    logger.debug("[OUR MESSAGE ECHOED] From: %s, To: %s, Channel: %s", sender_id, to_id, packet_channel)
+                else:
+                    logger.debug("[MESSAGE RECEIVED] From: %s, To: %s, Channel: %s", sender_id, to_id, packet_channel)
+                logger.debug("[MESSAGE CONTENT] '%s'", message_text)
+                logger.debug(_BANNER)
             
             # Only process commands from other users, not our own echoed messages
             if not is_our_message:
                 self._process_command(message_text, sender_id)
             
         except Exception as e:
-            logger.error(f"Error processing received message: {e}", exc_info=True)
+            logger.error("Error processing received message: %s", e, exc_info=True)
     
     def _process_command(self, message: str, sender_id=None):
         """
@@ -218,12 +261,14 @@ class MeshtasticListener:
             message: Command text to process
             sender_id: Optional ID of the message sender
         """
-        # Parse command
-        match = self.COMMAND_PATTERN.match(message.strip())
+        # Parse command; cheap first-word check so ordinary chatter skips the regex
+        stripped = message.strip()
+        head = stripped.split(None, 1)[0].lower() if stripped else ''
+        match = self.COMMAND_PATTERN.match(stripped) if head in _COMMANDS else None
         
         if not match:
-            logger.info(f"[DEBUG] Message does not match command pattern: '{message}'")
-            logger.info(f"[DEBUG] Expected pattern: '<command_type> <location>' (e.g., 'accidents 101')")
+            logger.debug("Message does not match command pattern: '%s'", message)
+            logger.debug("Expected pattern: '<command_type> <location>' (e.g., 'accidents 101')")
             return
         
         command_type = match.group(1).lower()
@@ -232,22 +277,17 @@ class MeshtasticListener:
         # Normalize interstate highway names (I10 -> I-10, i17 -> I-17, etc.)
         location = self._normalize_interstate(location)
         
-        logger.info(f"Processing command: {command_type} for location: {location}")
+        logger.info("Processing command: %s for location: %s", command_type, location)
         
         try:
-            if command_type == 'accidents':
-                self._handle_accidents_command(location)
-            elif command_type == 'events':
-                self._handle_events_command(location)
-            elif command_type == 'alerts':
-                self._handle_alerts_command(location)
-            elif command_type == 'weather':
-                self._handle_weather_command(location)
+            handler = self._handlers.get(command_type)
+            if handler:
+                handler(location)
             else:
-                logger.warning(f"Unknown command type: {command_type}")
+                logger.warning("Unknown command type: %s", command_type)
                 
         except Exception as e:
-            logger.error(f"Error handling command: {e}", exc_info=True)
+            logger.error("Error handling command: %s", e, exc_info=True)
             error_msg = f"Error processing {command_type} request: {str(e)[:100]}"
             self.mesh_sender.send_message(error_msg, channel_index=self.channel_index)
     
@@ -266,19 +306,12 @@ class MeshtasticListener:
         Returns:
             Normalized location string
         """
-        import re
-        # Match patterns like: I10, i10, I-10, i-10 (with or without dash)
-        # Captures: (I or i)(optional dash)(numbers)
-        pattern = r'\b([Ii])(-?)(\d+)\b'
+        # No 'I'/'i' at all means no interstate reference (e.g., "phoenix"); skip the regex
+        if 'i' not in location and 'I' not in location:
+            return location
         
-        def normalize_match(match):
-            # Always return uppercase I with dash and the numbers
-            return f"I-{match.group(3)}"
-        
-        # Replace all interstate patterns with normalized format
-        normalized = re.sub(pattern, normalize_match, location)
-        
-        return normalized
+        # Always use uppercase I with dash and the numbers (template expanded in C)
+        return _INTERSTATE_SUB(r'I-\3', location)
     
     def _handle_accidents_command(self, location: str):
         """
@@ -287,7 +320,7 @@ class MeshtasticListener:
         Args:
             location: Location to search for accidents
         """
-        logger.info(f"Fetching accidents for location: {location}")
+        logger.info("Fetching accidents for location: %s", location)
         
         # Fetch accidents from ADOT API
         accidents = self.adot_client.get_accidents(location=location)
@@ -301,13 +334,18 @@ class MeshtasticListener:
         # Limit results
         accidents_to_send = accidents[:self.max_results]
         
-        # Send each accident (sender will handle splitting if needed)
-        logger.info(f"Sending {len(accidents_to_send)} accident(s) for '{location}'")
-        
-        for accident in accidents_to_send:
-            message = self._format_accident_message(accident)
-            logger.info(f"Sending: {message}")
-            self.mesh_sender.send_message(message, channel_index=self.channel_index)
+        # Send the accidents, packed into as few frames as possible
+        # (sender will handle splitting if needed)
+        logger.info("Sending %d accident(s) for '%s'", len(accidents_to_send), location)
+        
+        # One clock read for the whole batch
+        now = datetime.now(arizona_tz())
+        fmt = format_accident
+        max_age_seconds = self.max_age_seconds
+        messages = [fmt(accident, now, max_age_seconds) for accident in accidents_to_send]
+        for message in messages:
+            logger.info("Sending: %s", message)
+        self.mesh_sender.send_messages(messages, channel_index=self.channel_index)
     
     def _handle_events_command(self, location: str):
         """
@@ -316,33 +354,30 @@ class MeshtasticListener:
         Args:
             location: Location to search for events
         """
-        logger.info(f"Fetching events for location: {location}")
+        logger.info("Fetching events for location: %s", location)
         
         # Fetch events from ADOT API
         events = self.adot_client.get_events(location=location)
         
-        # Filter out accidents (use 'accidents' command for those)
-        non_accident_events = [
-            event for event in events
-            if 'accident' not in event.get('EventType', '').lower()
-        ]
+        # Filter out accidents (use 'accidents' command for those), stopping
+        # as soon as enough events have been found
+        events_to_send = list(islice(filterfalse(is_accident, events), self.max_results))
         
-        if not non_accident_events:
+        if not events_to_send:
             response = f"No events found for '{location}'"
             logger.info(response)
             self.mesh_sender.send_message(response, channel_index=self.channel_index)
             return
         
-        # Limit results
-        events_to_send = non_accident_events[:self.max_results]
-        
-        # Send each event (sender will handle splitting if needed)
-        logger.info(f"Sending {len(events_to_send)} event(s) for '{location}'")
+        # Send the events, packed into as few frames as possible
+        # (sender will handle splitting if needed)
+        logger.info("Sending %d event(s) for '%s'", len(events_to_send), location)
         
-        for event in events_to_send:
-            message = self._format_event_message(event)
-            logger.info(f"Sending: {message}")
-            self.mesh_sender.send_message(message, channel_index=self.channel_index)
+        fmt = format_event
+        messages = [fmt(event) for event in events_to_send]
+        for message in messages:
+            logger.info("Sending: %s", message)
+        self.mesh_sender.send_messages(messages, channel_index=self.channel_index)
     
     def _handle_alerts_command(self, location: str):
         """
@@ -351,7 +386,7 @@ class MeshtasticListener:
         Args:
             location: Location to search for alerts
         """
-        logger.info(f"Fetching alerts for location: {location}")
+        logger.info("Fetching alerts for location: %s", location)
         
         # Fetch alerts from ADOT API
         alerts = self.adot_client.get_alerts()
@@ -378,11 +413,12 @@ class MeshtasticListener:
         self.mesh_sender.send_message(summary, channel_index=self.channel_index)
         
         # Send each alert
+        send = self.mesh_sender.send_message
+        ch = self.channel_index
         for alert in alerts_to_send:
-            # Format alert message based on actual API structure
-            message = str(alert)[:200]  # Simple truncation for now
-            logger.info(f"Sending: {message}")
-            self.mesh_sender.send_message(message, channel_index=self.channel_index)
+            message = format_alert(alert)
+            logger.info("Sending: %s", message)
+            send(message, channel_index=ch)
     
     def _handle_weather_command(self, location: str):
         """
@@ -395,95 +431,6 @@ class MeshtasticListener:
         logger.info(response)
         self.mesh_sender.send_message(response, channel_index=self.channel_index)
     
-    def _format_accident_message(self, accident: dict) -> str:
-        """
-        Format an accident dictionary into a concise message
-        
-        Args:
-            accident: Accident data dictionary
-            
-        Returns:
-            Formatted message string
-        """
-        roadway = accident.get('RoadwayName', 'Unknown road')
-        direction = accident.get('DirectionOfTravel', '')
-        lanes = accident.get('LanesAffected', '')
-        location = accident.get('Location', '')
-        last_updated_str = accident.get('LastUpdated', '')
-        
-        # Calculate elapsed time since last update
-        elapsed_str = ""
-        if last_updated_str:
-            try:
-                # Parse the timestamp string (format: '2025-12-11 14:30:00 MST')
-                timestamp_without_tz = ' '.join(last_updated_str.split()[:-1])
-                last_updated_dt = datetime.strptime(timestamp_without_tz, '%Y-%m-%d %H:%M:%S')
-                
-                # Make it timezone-aware (Arizona time)
-                arizona_tz = ZoneInfo('America/Phoenix')
-                last_updated_dt = last_updated_dt.replace(tzinfo=arizona_tz)
-                
-                # Get current time in Arizona timezone
-                now = datetime.now(arizona_tz)
-                
-                # Calculate elapsed time
-                elapsed = now - last_updated_dt
-                
-                # Format elapsed time
-                hours = int(elapsed.total_seconds() // 3600)
-                minutes = int((elapsed.total_seconds() % 3600) // 60)
-                
-                if hours > 0:
-                    elapsed_str = f"{hours}h{minutes}m ago"
-                else:
-                    elapsed_str = f"{minutes}m ago"
-            except Exception as e:
-                logger.warning(f"Error calculating elapsed time: {e}")
-                elapsed_str = ""
-        
-        # Build compact message
-        parts = [f"ACCIDENT: {roadway}"]
-        
-        if direction:
-            parts.append(f"({direction})")
-        
-        if lanes and lanes != "No Data":
-            parts.append(f"Lanes: {lanes}")
-        
-        if location:
-            parts.append(f"@ {location}")
-        
-        if elapsed_str:
-            parts.append(f"[{elapsed_str}]")
-        
-        return " ".join(parts)
-    
-    def _format_event_message(self, event: dict) -> str:
-        """
-        Format an event dictionary into a concise message
-        
-        Args:
-            event: Event data dictionary
-            
-        Returns:
-            Formatted message string
-        """
-        roadway = event.get('RoadwayName', 'Unknown road')
-        event_type = event.get('EventType', 'Event')
-        direction = event.get('DirectionOfTravel', '')
-        location = event.get('Location', '')
-        
-        # Build compact message
-        parts = [f"{event_type.upper()}: {roadway}"]
-        
-        if direction:
-            parts.append(f"({direction})")
-        
-        if location:
-            parts.append(f"@ {location}")
-        
-        return " ".join(parts)
-    
     def test_command(self, command: str):
         """
         Test a command without requiring Meshtastic connection
@@ -491,7 +438,7 @@ class MeshtasticListener:
         Args:
             command: Command string to test
         """
-        logger.info(f"Testing command: {command}")
+        logger.info("Testing command: %s", command)
         self._process_command(command)
     
     def simulate_message(self, message: str, sender_id: str = "!test1234", channel: int = 0):
@@ -503,9 +450,9 @@ class MeshtasticListener:
             sender_id: Simulated sender ID
             channel: Simulated channel
         """
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         logger.info("SIMULATING MESSAGE RECEPTION")
-        logger.info("=" * 70)
+        logger.info(_BANNER)
         
         # Create a simulated packet
         packet = {
@@ -559,6 +506,10 @@ def main():
     tcp_port = int(os.getenv("MESHTASTIC_TCP_PORT", "4403"))
     channel_index = int(os.getenv("MESHTASTIC_CHANNEL_INDEX", "0"))
     max_results = int(os.getenv("MAX_RESULTS_PER_QUERY", "3"))
+    nominatim_url = os.getenv("NOMINATIM_URL")
+    want_ack = os.getenv("MESHTASTIC_WANT_ACK", "true").lower() == "true"
+    elapsed_max_hours = int(os.getenv("ADOT_ELAPSED_MAX_HOURS", "48"))
+    cache_ttl_secs = int(os.environ["ADOT_CACHE_TTL_SECS"]) if os.getenv("ADOT_CACHE_TTL_SECS") else None
     
     # Initialize listener
     listener = MeshtasticListener(
@@ -568,7 +519,11 @@ def main():
         tcp_port=tcp_port,
         connection_type=connection_type,
         channel_index=channel_index,
-        max_results=max_results
+        max_results=max_results,
+        nominatim_url=nominatim_url,
+        want_ack=want_ack,
+        elapsed_max_hours=elapsed_max_hours,
+        cache_ttl_secs=cache_ttl_secs
     )
     
     # Test mode or run listener
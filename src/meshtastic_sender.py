@@ -4,15 +4,156 @@ Handles sending messages to Meshtastic mesh network devices
 """
 
 import logging
-from typing import List, Dict, Optional
+import math
+import queue
+import socket
+import threading
+import time
+from bisect import bisect_right
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import accumulate
+from typing import List, Dict, Optional, Tuple
+from .formatters import format_incident
+
+try:
+    import meshtastic.serial_interface
+    import meshtastic.tcp_interface
+except ImportError:  # Only needed once a device is connected
+    meshtastic = None
 
 logger = logging.getLogger(__name__)
 
+# LoRa settings of the Meshtastic modem presets:
+# (spreading factor, bandwidth in Hz, coding rate denominator, i.e. 4/5 -> 5)
+_MODEM_PRESETS = {
+    'LONG_FAST': (11, 250_000, 5),
+    'LONG_SLOW': (12, 125_000, 8),
+    'LONG_MODERATE': (11, 125_000, 8),
+    'VERY_LONG_SLOW': (12, 62_500, 8),
+    'MEDIUM_SLOW': (10, 250_000, 5),
+    'MEDIUM_FAST': (9, 250_000, 5),
+    'SHORT_SLOW': (8, 250_000, 5),
+    'SHORT_FAST': (7, 250_000, 5),
+    'SHORT_TURBO': (7, 500_000, 5)
+}
+_DEFAULT_PRESET = 'LONG_FAST'  # Meshtastic's default
+
+
+def _utf8_len(text: str) -> int:
+    """Size of text on air in bytes (ASCII, the common case, needs no encoding)"""
+    return len(text) if text.isascii() else len(text.encode('utf-8'))
+
+
+def _compute_airtime(payload_len: int, sf: int, bw: int, cr: int, preamble: int = 16) -> float:
+    """
+    Time-on-air of one LoRa packet (explicit header, CRC on)
+    
+    Args:
+        payload_len: Packet size in bytes
+        sf: Spreading factor (7-12)
+        bw: Bandwidth in Hz
+        cr: Coding rate denominator (5-8)
+        preamble: Preamble length in symbols (Meshtastic uses 16)
+        
+    Returns:
+        Airtime in seconds
+    """
+    t_sym = (2 ** sf) / bw
+    # Low data rate optimization is enabled for symbols longer than 16 ms
+    de = 1 if t_sym > 0.016 else 0
+    payload_symbols = 8 + max(math.ceil((8 * payload_len - 4 * sf + 44) / (4 * (sf - 2 * de))) * cr, 0)
+    return (preamble + 4.25 + payload_symbols) * t_sym
+
+
+@lru_cache(maxsize=256)
+def _split_text(message: str, max_length: int, break_chars: Tuple[str, ...]) -> Tuple[str, ...]:
+    """
+    Split message into parts at the last break character in each window
+    
+    Cached: the same long alerts and replies come back across polls and queries.
+    See MeshtasticSender._split_message for the arguments.
+    """
+    # Byte offset of every character, so the limit applies to the encoded size.
+    # ASCII text is one byte per character and skips this
+    offsets = None
+    if not message.isascii():
+        offsets = [0, *accumulate(len(c.encode('utf-8')) for c in message)]
+    
+    if (offsets[-1] if offsets else len(message)) <= max_length:
+        return (message,)
+    
+    # Plain append and an f-string prefix: a preallocated list and ''.join both
+    # measured slower for the few parts a message splits into
+    parts = []
+    n = len(message)
+    start = 0  # Cursor into message; no intermediate remainder strings are built
+    
+    while start < n:
+        # End of the longest window that fits (at least one character)
+        if offsets is None:
+            hi = start + max_length
+        else:
+            hi = max(bisect_right(offsets, offsets[start] + max_length) - 1, start + 1)
+        
+        if hi >= n:
+            # Last part
+            parts.append(message[start:])
+            break
+        
+        # Find a good break point (space, comma, parenthesis) in the second half of
+        # the window, searching backwards from its end
+        lo = start + (hi - start) // 2 + 1
+        cut = -1
+        for c in break_chars:
+            k = message.rfind(c, lo, hi)
+            if k > cut:
+                cut = k
+        end = cut + 1 if cut >= 0 else hi
+        
+        # Extract this part
+        part = message[start:end].rstrip()
+        
+        # Add continuation indicator if not the first part
+        if parts:
+            part = f"...{part}"
+        
+        parts.append(part)
+        
+        # Skip whitespace before the next part
+        start = end
+        while start < n and message[start].isspace():
+            start += 1
+    
+    return tuple(parts)
+
 
 class MeshtasticSender:
     """Client for sending messages to Meshtastic devices"""
     
-    MAX_MESSAGE_LENGTH = 200  # Maximum message length for Meshtastic
+    MAX_MESSAGE_LENGTH = 200  # Maximum message length for Meshtastic (UTF-8 bytes)
+    
+    # Bytes Meshtastic adds around the text (mesh header + protobuf framing)
+    PACKET_OVERHEAD_BYTES = 24
+    # Extra spacing after each packet's airtime to leave room for rebroadcasts (seconds)
+    TX_GUARD_SECONDS = 0.25
+    # Characters after which a long message may be split
+    _BREAK_CHARS = (' ', ',', ')', ']', '@', '-')
+    
+    # How long to keep waiting for a packet's ACK once its airtime has passed (seconds)
+    ACK_GRACE_SECONDS = 2.0
+    
+    # TCP keepalive: probe after 30s idle, every 10s, give up after 3 missed probes
+    KEEPALIVE_IDLE_SECS = 30
+    KEEPALIVE_INTERVAL_SECS = 10
+    KEEPALIVE_PROBES = 3
+    
+    # Alerts already sent are skipped for this long (seconds); at most this many are remembered
+    RECENT_ALERT_TTL_SECS = 1800
+    RECENT_ALERTS_MAX = 512
+    
+    # Batches waiting for the background send worker; the oldest is dropped when full
+    SEND_QUEUE_SIZE = 64
     
     def __init__(
         self, 
@@ -20,7 +161,8 @@ class MeshtasticSender:
         tcp_host: str = None, 
         tcp_port: int = 4403,
         connection_type: str = "serial",
-        channel_index: int = 0
+        channel_index: int = 0,
+        want_ack: bool = True
     ):
         """
         Initialize Meshtastic sender
@@ -31,30 +173,125 @@ class MeshtasticSender:
             tcp_port: TCP port number (default: 4403)
             connection_type: Connection type - "serial" or "tcp" (default: "serial")
             channel_index: Channel index to send messages on (default: 0)
+            want_ack: Request ACKs and wait for them; False sends fire-and-forget (default: True)
         """
         self.device_path = device_path
         self.tcp_host = tcp_host
         self.tcp_port = tcp_port
         self.connection_type = connection_type
         self.channel_index = channel_index
+        self.want_ack = want_ack
         self.interface = None
+        self._lora_params: Optional[Tuple[int, int, int]] = None
+        self._tx_ready_at = 0.0
+        # Set when the most recently sent packet is ACKed, waking _wait_for_channel early
+        self._last_ack_entry = None
+        self._channel_clear = threading.Event()
+        # Alert message -> monotonic time it was sent, oldest first (written by the worker)
+        self._recent_alerts: "OrderedDict[str, float]" = OrderedDict()
+        self._recent_lock = threading.Lock()
+        # (messages, channel index, are alerts) batches for the worker; None tells it to exit
+        self._send_queue = queue.Queue(maxsize=self.SEND_QUEUE_SIZE)
+        self._worker = threading.Thread(target=self._pump, name="meshtastic-sender", daemon=True)
+        # Serializes transmissions (and their pacing/ACK state) across threads
+        self._tx_lock = threading.Lock()
         
         # Initialize meshtastic interface based on connection type
-        if connection_type == "tcp" and tcp_host:
-            import meshtastic.tcp_interface
-            self.interface = meshtastic.tcp_interface.TCPInterface(hostname=tcp_host, portNumber=tcp_port)
-        elif connection_type == "serial" and device_path:
-            import meshtastic.serial_interface
-            self.interface = meshtastic.serial_interface.SerialInterface(devPath=device_path)
+        wants_device = (connection_type == "tcp" and tcp_host) or (connection_type == "serial" and device_path)
+        if wants_device and meshtastic is None:
+            raise ImportError("The meshtastic package is required to connect to a device")
+        self.interface = self._connect()
+        
+        # Started only once connected, so a failed connect doesn't leave a thread behind
+        self._worker.start()
+    
+    def __enter__(self):
+        """Use the sender as a context manager that keeps one connection open"""
+        return self
+    
+    def __exit__(self, exc_type, exc, tb):
+        """Close the connection when the block exits"""
+        self.close()
+        return False
+    
+    def _connect(self):
+        """
+        Open the Meshtastic interface for the configured connection
+        
+        Returns:
+            Connected interface, or None if no device is configured
+        """
+        interface = None
+        if self.connection_type == "tcp" and self.tcp_host:
+            interface = meshtastic.tcp_interface.TCPInterface(hostname=self.tcp_host, portNumber=self.tcp_port)
+            self._enable_keepalive(interface)
+            
+            # meshtastic reconnects the socket by itself (on a failed read or write); keep
+            # keepalive on every socket it opens
+            connect = interface.myConnect
+            
+            def myConnect():
+                connect()
+                self._enable_keepalive(interface)
+            
+            interface.myConnect = myConnect
+        elif self.connection_type == "serial" and self.device_path:
+            interface = meshtastic.serial_interface.SerialInterface(devPath=self.device_path)
         # else:
         #     # Default to auto-discovery
-        #     import meshtastic.serial_interface
-        #     self.interface = meshtastic.serial_interface.SerialInterface()
+        #     interface = meshtastic.serial_interface.SerialInterface()
+        return interface
+    
+    def _enable_keepalive(self, interface):
+        """
+        Turn on TCP keepalive so a dead link is noticed while the connection sits idle
+        
+        Args:
+            interface: Meshtastic interface (ignored unless it has a TCP socket)
+        """
+        sock = getattr(interface, 'socket', None)
+        if sock is None:
+            return
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            # The tuning options are platform specific (Linux has all three)
+            for name, value in (
+                ('TCP_KEEPIDLE', self.KEEPALIVE_IDLE_SECS),
+                ('TCP_KEEPINTVL', self.KEEPALIVE_INTERVAL_SECS),
+                ('TCP_KEEPCNT', self.KEEPALIVE_PROBES)
+            ):
+                if hasattr(socket, name):
+                    sock.setsockopt(socket.IPPROTO_TCP, getattr(socket, name), value)
+        except OSError as e:
+            logger.warning("Could not enable TCP keepalive: %s", e)
+    
+    def _recover_connection(self):
+        """Get a working connection back after sendText failed with a broken link"""
+        interface = self.interface
+        is_connected = getattr(interface, 'isConnected', None)
+        if getattr(interface, 'socket', None) is not None and is_connected is not None and is_connected.is_set():
+            # meshtastic's TCPInterface already reopened its socket before re-raising the
+            # error; resend on it rather than tearing down the fresh connection
+            logger.warning("Meshtastic connection was reset, resending on the reconnected socket")
+            return
+        self._reconnect()
+    
+    def _reconnect(self):
+        """Replace a broken interface with a fresh connection"""
+        logger.warning("Meshtastic connection lost, reconnecting...")
+        try:
+            self.interface.close()
+        except Exception as e:
+            logger.debug("Error closing broken interface: %s", e)
+        self.interface = self._connect()
+        if self.interface is None:
+            raise ConnectionError("No Meshtastic device configured to reconnect to")
+        logger.info("Reconnected to Meshtastic device")
     
     def send_message(self, message: str, channel_index: Optional[int] = None) -> bool:
         """
         Send a message to the Meshtastic network
-        Automatically splits messages longer than 200 characters
+        Automatically splits messages longer than 200 bytes
         
         Args:
             message: Text message to send
@@ -64,46 +301,56 @@ class MeshtasticSender:
             True if successful, False otherwise
         """
         try:
+            # Resolve attributes once (also keeps one interface for the whole call)
+            iface = self.interface
+            max_len = self.MAX_MESSAGE_LENGTH
             channel = channel_index if channel_index is not None else self.channel_index
             
             # Split message if it exceeds maximum length
-            if len(message) > self.MAX_MESSAGE_LENGTH:
-                logger.info(f"Message length {len(message)} exceeds {self.MAX_MESSAGE_LENGTH}, splitting into parts")
-                messages = self._split_message(message, self.MAX_MESSAGE_LENGTH)
+            size = _utf8_len(message)
+            if size > max_len:
+                logger.info("Message length %d exceeds %d, splitting into parts", size, max_len)
+                messages = self._split_message(message, max_len)
                 
-                # Send each part
                 for i, msg_part in enumerate(messages, 1):
-                    logger.info(f"Sending part {i}/{len(messages)} on channel {channel}: {msg_part[:50]}...")
-                    if self.interface:
-                        try:
-                            result = self.interface.sendText(msg_part, channelIndex=channel)
-                            logger.info(f"Part {i}/{len(messages)} sent successfully (ID: {result.id})")
-                            # Give time for each part to transmit before sending the next
-                            # Meshtastic needs significant time between messages to avoid collisions
-                            import time
-                            time.sleep(2.0)
-                        except Exception as e:
-                            logger.error(f"Error sending part {i}: {e}")
+                    logger.info("Sending part %d/%d on channel %s: %.50s...", i, len(messages), channel, msg_part)
+                if not iface:
+                    logger.warning("No Meshtastic interface available, message not sent")
+                    return True
+                
+                # Queue all parts with the radio back-to-back, then wait for their ACKs once
+                try:
+                    results = self._transmit_many(messages, channel)
+                except Exception as e:
+                    logger.error("Error sending parts: %s", e)
+                    return False
+                
+                all_delivered = True
+                for i, (packet_id, delivered) in enumerate(results, 1):
+                    if delivered is False:
+                        logger.warning("Part %d/%d was not delivered (ID: %s)", i, len(messages), packet_id)
+                        all_delivered = False
                     else:
-                        logger.warning("No Meshtastic interface available, message not sent")
+                        logger.info("Part %d/%d sent successfully (ID: %s)", i, len(messages), packet_id)
                 
-                return True
+                # Like a single message, a rejected part means the message didn't get through
+                return all_delivered
             else:
                 # Send single message
-                logger.info(f"Sending message on channel {channel}: {message[:50]}...")
-                logger.debug(f"Interface object: {self.interface}")
-                logger.debug(f"Interface type: {type(self.interface)}")
+                logger.info("Sending message on channel %s: %.50s...", channel, message)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Interface object: %s", iface)
+                    logger.debug("Interface type: %s", type(iface))
                 
-                if self.interface:
+                if iface:
                     try:
-                        result = self.interface.sendText(message, channelIndex=channel)
-                        logger.info(f"Message sent successfully (ID: {result.id})")
-                        # Give time for the message to actually transmit over the TCP connection
-                        # Meshtastic needs significant time between messages to avoid collisions
-                        import time
-                        time.sleep(2.0)
+                        packet_id, delivered = self._transmit(message, channel)
+                        if delivered is False:
+                            logger.warning("Message was not delivered (ID: %s)", packet_id)
+                            return False
+                        logger.info("Message sent successfully (ID: %s)", packet_id)
                     except Exception as e:
-                        logger.error(f"Error during sendText: {e}")
+                        logger.error("Error during sendText: %s", e)
                         return False
                 else:
                     logger.warning("No Meshtastic interface available, message not sent")
@@ -111,84 +358,334 @@ class MeshtasticSender:
                 return True
             
         except Exception as e:
-            logger.error(f"Error sending message: {e}")
+            logger.error("Error sending message: %s", e)
             return False
     
-    def _split_message(self, message: str, max_length: int) -> List[str]:
+    def _transmit(self, text: str, channel: int) -> Tuple[int, Optional[bool]]:
         """
-        Split a long message into multiple messages at logical breakpoints
+        Send one packet and wait for its ACK, bounded by its airtime plus ACK_GRACE_SECONDS
         
         Args:
-            message: Message to split
-            max_length: Maximum length per message
+            text: Text to send (must fit in one packet)
+            channel: Channel index to send on
             
         Returns:
-            List of message parts
+            (packet ID, True if ACKed / False if NAKed / None if no answer arrived in time)
         """
-        if len(message) <= max_length:
-            return [message]
+        return self._transmit_many([text], channel)[0]
+    
+    def _transmit_many(self, texts: List[str], channel: int) -> List[Tuple[int, Optional[bool]]]:
+        """
+        Hand several packets to the radio back-to-back, then wait once for all their ACKs
         
-        messages = []
-        remaining = message
-        part_num = 1
+        The radio queues the packets and transmits them in turn (sendText itself blocks
+        if the device's queue is full), so the caller only waits for the combined airtime.
         
-        while remaining:
-            if len(remaining) <= max_length:
-                # Last part
-                messages.append(remaining)
-                break
+        Args:
+            texts: Texts to send, in order (each must fit in one packet)
+            channel: Channel index to send on
             
-            # Find a good break point (space, comma, parenthesis)
-            break_point = max_length
+        Returns:
+            (packet ID, True if ACKed / False if NAKed / None if no answer arrived in time)
+            for each text, in order (always None when want_ack is off)
+        """
+        # One sender at a time: the worker and synchronous callers share the radio,
+        # its pacing state and the ACK bookkeeping
+        with self._tx_lock:
+            # Wait for the previous packet to clear the air to avoid collisions
+            self._wait_for_channel()
             
-            # Look for break characters in reverse from max_length
-            for i in range(max_length - 1, max_length // 2, -1):
-                if remaining[i] in [' ', ',', ')', ']', '@', '-']:
-                    break_point = i + 1
-                    break
+            entries = []
+            send_text = self.interface.sendText
+            mark_sent = self._mark_sent
+            want_ack = self.want_ack
+            self._channel_clear.clear()
+            for text in texts:
+                # [event set when the ACK/NAK arrives, routing error reason]; the handler is
+                # registered with the packet, so even an immediate answer can't be missed
+                entry = [threading.Event(), None]
+                on_response = self._ack_handler(entry) if want_ack else None
+                try:
+                    result = send_text(text, channelIndex=channel, wantAck=want_ack, onResponse=on_response)
+                except (BrokenPipeError, ConnectionResetError):
+                    # The link dropped while idle; reconnect once and resend
+                    self._recover_connection()
+                    send_text = self.interface.sendText
+                    result = send_text(text, channelIndex=channel, wantAck=want_ack, onResponse=on_response)
+                
+                entries.append((result.id, entry))
+                if want_ack:
+                    self._last_ack_entry = entry
+                mark_sent(text)
+            
+            if not want_ack:
+                # Fire-and-forget: the radio's own listen-before-talk handles the rest
+                return [(packet_id, None) for packet_id, _ in entries]
             
-            # Extract this part
-            part = remaining[:break_point].rstrip()
+            deadline = max(self._tx_ready_at, time.monotonic()) + self.ACK_GRACE_SECONDS
+            for packet_id, (event, _error) in entries:
+                if not event.wait(max(deadline - time.monotonic(), 0.0)):
+                    logger.debug("No ACK for packet %s by the deadline", packet_id)
             
-            # Add continuation indicator if not the first part
-            if part_num > 1:
-                part = f"...{part}"
+            results = []
+            for packet_id, (event, error) in entries:
+                if not event.is_set():
+                    results.append((packet_id, None))
+                elif error != 'NONE':
+                    logger.warning("Packet %s rejected: %s", packet_id, error)
+                    results.append((packet_id, False))
+                else:
+                    results.append((packet_id, True))
             
-            messages.append(part)
-            remaining = remaining[break_point:].lstrip()
-            part_num += 1
+            if all(event.is_set() for _, (event, _error) in entries):
+                # The ACKs mean our packets (and their first rebroadcasts) are off the air
+                self._tx_ready_at = min(self._tx_ready_at, time.monotonic() + self.TX_GUARD_SECONDS)
+            return results
+    
+    def _ack_handler(self, entry: list):
+        """
+        Build the response callback for one packet
+        
+        meshtastic calls it from the interface's reader thread, so the ACK arrives even
+        while the pubsub publishing thread is busy in a listener command that is sending.
         
-        return messages
+        Args:
+            entry: [event, error reason] completed when the ACK/NAK arrives
+            
+        Returns:
+            Callback for sendText's onResponse
+        """
+        def onAckNak(packet):  # meshtastic only passes plain ACKs to callbacks with this name
+            decoded = packet.get('decoded') or {}
+            entry[1] = (decoded.get('routing') or {}).get('errorReason', 'NONE')
+            entry[0].set()
+            
+            if entry is self._last_ack_entry:
+                # Our last packet is off the air, even if its ACK came after the send gave up
+                self._tx_ready_at = min(self._tx_ready_at, time.monotonic() + self.TX_GUARD_SECONDS)
+                self._channel_clear.set()
+        
+        return onAckNak
     
-    def send_alerts(self, incidents: List[Dict]) -> None:
+    def _get_lora_params(self) -> Tuple[int, int, int]:
         """
-        Format and send incident alerts
+        Read the radio's LoRa settings (cached after the first successful read)
+        
+        Returns:
+            (spreading factor, bandwidth in Hz, coding rate denominator); the
+            LONG_FAST preset if the device config can't be read
+        """
+        if self._lora_params is None:
+            params = None
+            try:
+                lora = self.interface.localNode.localConfig.lora
+                if lora.use_preset:
+                    preset = lora.DESCRIPTOR.fields_by_name['modem_preset'].enum_type.values_by_number[lora.modem_preset].name
+                    params = _MODEM_PRESETS.get(preset)
+                elif lora.spread_factor:
+                    params = (lora.spread_factor, int(lora.bandwidth * 1000), lora.coding_rate)
+            except Exception as e:
+                logger.debug("Could not read LoRa config, assuming %s: %s", _DEFAULT_PRESET, e)
+                return _MODEM_PRESETS[_DEFAULT_PRESET]
+            self._lora_params = params or _MODEM_PRESETS[_DEFAULT_PRESET]
+            logger.info("Pacing sends for LoRa SF%d, %g kHz, CR 4/%d", self._lora_params[0], self._lora_params[1] / 1000, self._lora_params[2])
+        return self._lora_params
+    
+    def _mark_sent(self, text: str):
+        """
+        Record a transmitted packet so the next send waits for its airtime
         
         Args:
-            incidents: List of incident data from ADOT API
+            text: Text that was sent
+        """
+        sf, bw, cr = self._get_lora_params()
+        airtime = _compute_airtime(_utf8_len(text) + self.PACKET_OVERHEAD_BYTES, sf, bw, cr)
+        # Packets queued back-to-back go out one after another
+        self._tx_ready_at = max(self._tx_ready_at, time.monotonic()) + airtime + self.TX_GUARD_SECONDS
+    
+    def _wait_for_channel(self):
+        """Wait until the last packet's expected airtime has passed, or its ACK arrives"""
+        delay = self._tx_ready_at - time.monotonic()
+        if delay > 0 and self._channel_clear.wait(delay):
+            # ACKed early; only the guard interval is left
+            delay = self._tx_ready_at - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+    
+    def send_messages(self, messages: List[str], channel_index: Optional[int] = None, separator: str = "\n") -> bool:
+        """
+        Send several messages, packing consecutive short ones into shared frames
+        
+        Messages are joined with the separator until the next one would exceed
+        MAX_MESSAGE_LENGTH. A message that is too long on its own is sent by itself
+        and split by send_message.
+        
+        Args:
+            messages: Text messages to send, in order
+            channel_index: Optional channel index to override default channel
+            separator: Text placed between packed messages (default: newline)
+            
+        Returns:
+            True if every frame was sent successfully, False otherwise
+        """
+        frames = self._pack_messages(messages, self.MAX_MESSAGE_LENGTH, separator)
+        logger.info("Packed %d message(s) into %d frame(s)", len(messages), len(frames))
+        
+        success = True
+        for frame in frames:
+            success = self.send_message(frame, channel_index=channel_index) and success
+        return success
+    
+    def queue_messages(self, messages: List[str], channel_index: Optional[int] = None):
+        """
+        Hand messages to the background worker and return without waiting for the radio
+        
+        The worker sends batches in order with send_messages. If the queue is full
+        the oldest waiting batch is dropped, since newer data supersedes it.
+        
+        Args:
+            messages: Text messages to send, in order
+            channel_index: Optional channel index to override default channel
+        """
+        self._enqueue((messages, channel_index, False))
+    
+    def _enqueue(self, item: Tuple[List[str], Optional[int], bool]):
+        """
+        Put a batch on the send queue, dropping the oldest waiting batch if it is full
+        
+        Args:
+            item: (messages, channel index, whether they are alerts to remember once sent)
         """
-        for incident in incidents:
-            # Format incident into a concise message
-            message = self._format_incident(incident)
-            self.send_message(message)
+        while True:
+            try:
+                self._send_queue.put_nowait(item)
+                return
+            except queue.Full:
+                try:
+                    self._send_queue.get_nowait()
+                    self._send_queue.task_done()
+                    logger.warning("Send queue full, dropped the oldest batch")
+                except queue.Empty:
+                    pass
     
-    def _format_incident(self, incident: Dict) -> str:
+    def _pump(self):
+        """Worker loop: send queued batches one at a time until close() is called"""
+        while True:
+            item = self._send_queue.get()
+            try:
+                if item is None:
+                    return
+                messages, channel_index, are_alerts = item
+                if self.send_messages(messages, channel_index=channel_index) and are_alerts:
+                    # Only alerts that actually went out are suppressed on later polls
+                    self._remember_alerts(messages)
+            except Exception as e:
+                logger.error("Error in send worker: %s", e)
+            finally:
+                self._send_queue.task_done()
+    
+    def _pack_messages(self, messages: List[str], max_length: int, separator: str) -> List[str]:
         """
-        Format an incident into a message string
+        Greedily combine consecutive messages into frames of at most max_length bytes
         
         Args:
-            incident: Incident data dictionary
+            messages: Messages to combine
+            max_length: Maximum UTF-8 size per frame
+            separator: Text placed between combined messages
             
         Returns:
-            Formatted message string
+            List of frames
+        """
+        frames = []
+        current = ""
+        current_size = 0
+        sep_size = _utf8_len(separator)
+        
+        for message in messages:
+            size = _utf8_len(message)
+            if not current:
+                current = message
+                current_size = size
+            elif current_size + sep_size + size <= max_length:
+                current = f"{current}{separator}{message}"
+                current_size += sep_size + size
+            else:
+                frames.append(current)
+                current = message
+                current_size = size
+        
+        if current:
+            frames.append(current)
+        
+        return frames
+    
+    def _split_message(self, message: str, max_length: int) -> List[str]:
+        """
+        Split a long message into multiple messages at logical breakpoints
+        
+        Args:
+            message: Message to split
+            max_length: Maximum UTF-8 size per message (before the "..." prefix)
+            
+        Returns:
+            List of message parts
+        """
+        return list(_split_text(message, max_length, self._BREAK_CHARS))
+    
+    def send_alerts(self, incidents: List[Dict]) -> None:
         """
-        # TODO: Customize formatting based on actual ADOT API response structure
-        location = incident.get('location', 'Unknown location')
-        description = incident.get('description', 'Traffic incident')
+        Format and queue incident alerts, packing short ones into shared frames
+        
+        Returns as soon as the alerts are queued; the send worker paces the radio.
         
-        return f"ADOT Alert: {description} at {location}"
+        Args:
+            incidents: List of incident data from ADOT API
+        """
+        # Format the whole batch in one pass, dropping repeats within it (order kept)
+        formatted = dict.fromkeys(map(format_incident, incidents))
+        
+        with self._recent_lock:
+            recent = self._recent_alerts
+            
+            # Forget alerts sent longer ago than the TTL (entries are in send order)
+            cutoff = time.monotonic() - self.RECENT_ALERT_TTL_SECS
+            while recent and next(iter(recent.values())) < cutoff:
+                recent.popitem(last=False)
+            
+            # Identical incidents come back on every poll; don't spend airtime on them again
+            messages = [message for message in formatted if message not in recent]
+        
+        if len(messages) < len(formatted):
+            logger.debug("Skipping %d recently sent alert(s)", len(formatted) - len(messages))
+        
+        # One packet per frame instead of one per incident; the worker records them
+        # as recently sent once send_messages succeeds
+        if messages:
+            self._enqueue((messages, None, True))
+    
+    def _remember_alerts(self, messages: List[str]):
+        """
+        Record alerts as sent so later polls skip them for RECENT_ALERT_TTL_SECS
+        
+        Args:
+            messages: Alert messages that were sent
+        """
+        now = time.monotonic()
+        with self._recent_lock:
+            recent = self._recent_alerts
+            for message in messages:
+                recent[message] = now
+                recent.move_to_end(message)
+            while len(recent) > self.RECENT_ALERTS_MAX:
+                recent.popitem(last=False)
     
     def close(self):
-        """Close the Meshtastic interface"""
+        """Send anything still queued, then close the Meshtastic interface"""
+        if self._worker.is_alive():
+            self._send_queue.put(None)
+            self._worker.join()
         if self.interface:
-            self.interface.close()
+            # Let the last packet (from any thread) go out before disconnecting
+            with self._tx_lock:
+                self._wait_for_channel()
+                self.interface.close()